@@ -5,7 +5,8 @@ Calculates and compares performance metrics for benchmarking.
 """
 
 import time
-from typing import Dict, List, Set, Optional
+from bisect import bisect_left
+from typing import Dict, FrozenSet, List, Set, Optional
 import json
 from pathlib import Path
 
@@ -30,6 +31,25 @@ class MetricsCalculator:
                          [{"items": [1, 2, 3], "target_support": 0.05}, ...]
         """
         self.ground_truth = ground_truth or []
+        
+        # Itemsets sorted by target support, so that any support threshold
+        # selects a suffix of the list
+        ranked = sorted(self.ground_truth, key=lambda p: p.get("target_support", 0))
+        self._gt_supports = [p.get("target_support", 0) for p in ranked]
+        self._gt_items = [frozenset(p["items"]) for p in ranked]
+        self._gt_cache: Dict[float, FrozenSet[FrozenSet[int]]] = {}
+    
+    def _ground_truth_sets(
+        self,
+        min_support_threshold: float
+    ) -> FrozenSet[FrozenSet[int]]:
+        """Ground truth itemsets with target support >= threshold (cached)."""
+        gt_sets = self._gt_cache.get(min_support_threshold)
+        if gt_sets is None:
+            start = bisect_left(self._gt_supports, min_support_threshold)
+            gt_sets = frozenset(self._gt_items[start:])
+            self._gt_cache[min_support_threshold] = gt_sets
+        return gt_sets
     
     def calculate_accuracy(
         self,
@@ -55,18 +75,18 @@ class MetricsCalculator:
                 "note": "No ground truth available"
             }
         
-        # Convert patterns to sets for comparison
-        ground_truth_sets = [
-            frozenset(p["items"]) for p in self.ground_truth
-            if p.get("target_support", 0) >= min_support_threshold
-        ]
-        
-        found_sets = [frozenset(p["items"]) for p in found_patterns]
+        # Convert patterns to sets of itemsets for O(1) membership tests
+        ground_truth_sets = self._ground_truth_sets(min_support_threshold)
+        found_sets = {frozenset(p["items"]) for p in found_patterns}
         
-        # Calculate metrics
-        true_positives = len([p for p in found_sets if p in ground_truth_sets])
-        false_positives = len([p for p in found_sets if p not in ground_truth_sets])
-        false_negatives = len([p for p in ground_truth_sets if p not in found_sets])
+        # Calculate metrics, probing the larger set from the smaller one
+        if len(found_sets) <= len(ground_truth_sets):
+            small, big = found_sets, ground_truth_sets
+        else:
+            small, big = ground_truth_sets, found_sets
+        true_positives = sum(1 for p in small if p in big)
+        false_positives = len(found_sets) - true_positives
+        false_negatives = len(ground_truth_sets) - true_positives
         
         # Precision: TP / (TP + FP)
         precision = (
@@ -7,7 +7,8 @@ Executes SPMF algorithms via subprocess and parses results.
 import subprocess
 import os
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 from pathlib import Path
 
 
@@ -67,7 +68,8 @@ class SPMFRunner:
         input_file: str,
         output_file: str,
         min_support: float,
-        timeout: int = 300
+        timeout: int = 300,
+        capture_logs: bool = False
     ) -> Dict:
         """
         Run a frequent itemset mining algorithm.
@@ -78,6 +80,9 @@ class SPMFRunner:
             output_file: Path to save results
             min_support: Minimum support threshold (0.0-1.0 or absolute count)
             timeout: Maximum execution time in seconds
+            capture_logs: Keep SPMF's stdout in the metrics. By default it
+                         is discarded (metrics["stdout"] is None); stderr is
+                         always captured for error reporting.
         
         Returns:
             Dictionary with execution metrics
@@ -113,9 +118,12 @@ class SPMFRunner:
         start_time = time.time()
         
         try:
+            # Unless requested, send the (possibly large) SPMF log straight
+            # to /dev/null instead of buffering and decoding it
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE if capture_logs else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=timeout,
                 check=True
@@ -135,9 +143,7 @@ class SPMFRunner:
             
             # Try to extract patterns count from output file
             try:
-                with open(output_file, "r") as f:
-                    patterns = f.readlines()
-                metrics["num_patterns_found"] = len(patterns)
+                metrics["num_patterns_found"] = self._count_lines(output_file)
             except Exception:
                 metrics["num_patterns_found"] = None
             
@@ -155,6 +161,69 @@ class SPMFRunner:
                 f"Error: {e.stderr}"
             )
     
+    def run_many(
+        self,
+        jobs: List[Dict],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[Dict, Exception]]:
+        """
+        Run several algorithms in parallel.
+        
+        Each job runs in its own JVM subprocess; threads are enough to
+        overlap them because the GIL is released while waiting on the
+        subprocess. Note that every JVM may use up to java_memory.
+        
+        Args:
+            jobs: Keyword arguments for run_algorithm, one dict per run
+                  (e.g. {"algorithm": "Apriori", "input_file": ...,
+                  "output_file": ..., "min_support": 0.05})
+            max_workers: Maximum concurrent runs (default: number of CPUs)
+            return_exceptions: Return the exception of a failing job in
+                               its place instead of raising it, so the
+                               other results are kept
+        
+        Returns:
+            Execution metrics of each job, in the order of jobs
+        
+        Raises:
+            Same exceptions as run_algorithm, for the first failing job
+            (unless return_exceptions is set)
+        """
+        if not jobs:
+            return []
+        
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.run_algorithm, **job) for job in jobs]
+            if not return_exceptions:
+                return [future.result() for future in futures]
+            
+            # Jobs run to completion either way; only collection differs
+            return [future.exception() or future.result() for future in futures]
+    
+    @staticmethod
+    def _count_lines(filepath: str, block_size: int = 1 << 20) -> int:
+        """
+        Count lines in a file without loading it into memory.
+        
+        Reads fixed-size binary blocks and counts newlines with bytes.count;
+        a final line without a trailing newline is counted as well.
+        """
+        count = 0
+        last = b"\n"
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                count += block.count(b"\n")
+                last = block[-1:]
+        
+        if last != b"\n":
+            count += 1
+        
+        return count
+    
     def parse_output(self, output_file: str) -> List[Dict]:
         """
         Parse SPMF output file to extract patterns.
@@ -168,31 +237,21 @@ class SPMFRunner:
         patterns = []
         
         try:
-            with open(output_file, "r") as f:
+            # Binary mode: int() parses ASCII bytes directly, so lines are
+            # never decoded to str
+            with open(output_file, "rb", buffering=1 << 20) as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
                     
-                    # SPMF format: items #SUP: support
-                    if "#SUP:" in line:
-                        parts = line.split("#SUP:")
-                        items_str = parts[0].strip()
-                        support = int(parts[1].strip())
-                        
-                        items = [int(x) for x in items_str.split()]
-                        
-                        patterns.append({
-                            "items": items,
-                            "support": support
-                        })
-                    else:
-                        # Simple format: just items
-                        items = [int(x) for x in line.split()]
-                        patterns.append({
-                            "items": items,
-                            "support": None
-                        })
+                    # SPMF format: items #SUP: support (simple format has
+                    # no separator, in which case head is the whole line)
+                    head, sep, tail = line.partition(b"#SUP:")
+                    patterns.append({
+                        "items": list(map(int, head.split())),
+                        "support": int(tail) if sep else None
+                    })
         
         except Exception as e:
             print(f"Warning: Could not parse output file: {e}")
@@ -5,7 +5,8 @@ Main engine for generating synthetic transactional datasets.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from scipy import sparse
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 from .distributions import DistributionEngine
@@ -20,6 +21,12 @@ class DataGenerator:
     realistic benchmark datasets for data mining algorithms.
     """
     
+    # Upper bound on the temporary (rows x items) arrays used while sampling
+    SAMPLE_BLOCK_CELLS = 1 << 22
+    
+    # Transactions joined per write by to_spmf
+    SPMF_BLOCK_ROWS = 1 << 16
+    
     def __init__(self, config: Dict):
         """
         Initialize generator with configuration.
@@ -43,32 +50,47 @@ class DataGenerator:
         # Initialize components
         self.dist_engine = DistributionEngine()
         self.injector = PatternInjector(self.num_transactions, self.num_items)
+        self._item_frequencies: Optional[Callable[[], np.ndarray]] = None
+        
+        # ASCII form of every item ID, so writers never re-format the ints
+        self._item_labels = [str(i).encode("ascii") for i in range(self.num_items)]
         
-        # Will hold generated data
-        self.data: Optional[np.ndarray] = None
+        # Will hold generated data (sparse binary matrix)
+        self.data: Optional[sparse.csr_matrix] = None
+        
+        # Random generator of the last generate() call
+        self.rng: Optional[np.random.Generator] = None
     
-    def generate(self, seed: Optional[int] = None) -> np.ndarray:
+    def generate(
+        self,
+        seed: Union[int, np.random.Generator, None] = None
+    ) -> sparse.csr_matrix:
         """
         Generate the complete dataset.
         
         Args:
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility, or a Generator to draw from
         
         Returns:
-            Binary matrix (num_transactions x num_items)
+            Binary CSR matrix (num_transactions x num_items), dtype int8
         """
-        if seed is not None:
-            np.random.seed(seed)
+        # One Generator (PCG64) drives sampling and injection. It is built
+        # fresh on every call so that the same seed gives the same dataset
+        self.rng = np.random.default_rng(seed)
+        self.injector.rng = self.rng
         
-        # Step 1: Generate item frequency distribution
-        item_probs = self.dist_engine.generate_item_frequencies(
-            self.num_items,
-            method=self.dist_config["method"],
-            params=self.dist_config["params"]
-        )
+        # Step 1: Generate item frequency distribution (computed on the
+        # first call only; the configuration does not change between calls)
+        if self._item_frequencies is None:
+            self._item_frequencies = self.dist_engine.compile(
+                self.num_items,
+                method=self.dist_config["method"],
+                params=self.dist_config["params"]
+            )
+        item_probs = self._item_frequencies()
         
         # Step 2: Generate base transactions
-        self.data = self._generate_transactions(item_probs)
+        self.data = self._generate_transactions(item_probs, self.rng)
         
         # Step 3: Inject patterns (if any)
         if self.patterns:
@@ -79,39 +101,107 @@ class DataGenerator:
         
         return self.data
     
-    def _generate_transactions(self, item_probs: np.ndarray) -> np.ndarray:
+    def _generate_transactions(
+        self,
+        item_probs: np.ndarray,
+        rng: np.random.Generator
+    ) -> sparse.csr_matrix:
         """
         Generate base transactions using item probabilities.
         
+        Rows are sampled in vectorized blocks of at most SAMPLE_BLOCK_CELLS
+        matrix cells, so temporary arrays stay bounded for large datasets.
+        
         Args:
             item_probs: Probability distribution over items
+            rng: Random generator used for lengths and item sampling
+        
+        Returns:
+            Binary CSR matrix (num_transactions x num_items)
+        """
+        num_trans, num_items = self.num_transactions, self.num_items
+        
+        # Determine transaction lengths
+        if self.avg_transaction_len:
+            # Use Poisson distribution around average
+            lengths = rng.poisson(self.avg_transaction_len, size=num_trans)
+            lengths = lengths.clip(1, num_items)
+        else:
+            # Use density-based approach
+            trans_len = max(1, int(num_items * self.density))
+            lengths = np.full(num_trans, trans_len)
+        
+        uniform = bool(np.all(item_probs == item_probs[0]))
+        with np.errstate(divide="ignore"):
+            log_probs = np.log(item_probs)
+        
+        # Build the CSR arrays directly from the sampled items: row i owns
+        # indices[indptr[i]:indptr[i + 1]]
+        block_rows = max(1, self.SAMPLE_BLOCK_CELLS // num_items)
+        indices = np.concatenate([
+            self._sample_rows(lengths[start:start + block_rows], log_probs, uniform, rng)
+            for start in range(0, num_trans, block_rows)
+        ])
+        indptr = np.zeros(num_trans + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        
+        data = sparse.csr_matrix(
+            (np.ones(indices.size, dtype=np.int8), indices, indptr),
+            shape=(num_trans, num_items)
+        )
+        # SPMF expects the items of a transaction in ascending order
+        data.sort_indices()
+        
+        return data
+    
+    def _sample_rows(
+        self,
+        lengths: np.ndarray,
+        log_probs: np.ndarray,
+        uniform: bool,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        Sample the items of a block of transactions without replacement.
+        
+        Uses the Gumbel-top-k trick: adding Gumbel noise to the
+        log-probabilities and keeping the k largest keys of a row is
+        equivalent to drawing k items without replacement with these
+        probabilities. Uniform probabilities skip the keys and shuffle each
+        row instead.
+        
+        Args:
+            lengths: Number of items of each transaction in the block
+            log_probs: Log-probabilities of the items
+            uniform: Whether all items have the same probability
+            rng: Random generator
         
         Returns:
-            Binary matrix (num_transactions x num_items)
-        """
-        data = np.zeros((self.num_transactions, self.num_items), dtype=np.int8)
-        
-        for i in range(self.num_transactions):
-            # Determine transaction length
-            if self.avg_transaction_len:
-                # Use Poisson distribution around average
-                trans_len = np.random.poisson(self.avg_transaction_len)
-                trans_len = max(1, min(trans_len, self.num_items))
-            else:
-                # Use density-based approach
-                trans_len = max(1, int(self.num_items * self.density))
+            Selected item IDs of all rows, concatenated in row order
+        """
+        num_rows, num_items = len(lengths), len(log_probs)
+        max_len = int(lengths.max())
+        
+        if uniform:
+            # Every prefix of a row-wise shuffle is an unweighted sample
+            # without replacement
+            all_items = np.broadcast_to(np.arange(num_items), (num_rows, num_items))
+            top = rng.permuted(all_items, axis=1)[:, :max_len]
+        else:
+            # Perturbed log-probabilities, one row of keys per transaction
+            keys = rng.gumbel(size=(num_rows, num_items)) + log_probs
             
-            # Sample items based on probabilities
-            selected_items = np.random.choice(
-                self.num_items,
-                size=trans_len,
-                replace=False,
-                p=item_probs
-            )
+            # Keep the top max_len keys of each row
+            top = np.argpartition(-keys, max_len - 1, axis=1)[:, :max_len]
             
-            data[i, selected_items] = 1
+            if lengths.min() < max_len:
+                # Variable lengths: order each row by key so that any prefix
+                # is itself a weighted sample without replacement
+                order = np.argsort(-np.take_along_axis(keys, top, axis=1), axis=1)
+                top = np.take_along_axis(top, order, axis=1)
         
-        return data
+        keep = np.arange(max_len) < lengths[:, None]
+        return top[keep]
     
     def get_statistics(self) -> Dict:
         """
@@ -123,14 +213,16 @@ class DataGenerator:
         if self.data is None:
             raise RuntimeError("Data not generated yet. Call generate() first.")
         
-        transaction_lengths = self.data.sum(axis=1)
-        item_frequencies = self.data.sum(axis=0)
+        # Both axes straight from the CSR arrays in O(nnz); every row/column
+        # statistic below is taken from these small 1D arrays
+        transaction_lengths = np.diff(self.data.indptr)
+        item_frequencies = np.bincount(self.data.indices, minlength=self.num_items)
         
         stats = {
             "num_transactions": self.num_transactions,
             "num_items": self.num_items,
-            "total_entries": int(self.data.sum()),
-            "actual_density": float(self.data.sum() / (self.num_transactions * self.num_items)),
+            "total_entries": int(self.data.nnz),
+            "actual_density": float(self.data.nnz / (self.num_transactions * self.num_items)),
             "avg_transaction_length": float(transaction_lengths.mean()),
             "std_transaction_length": float(transaction_lengths.std()),
             "min_transaction_length": int(transaction_lengths.min()),
@@ -144,20 +236,38 @@ class DataGenerator:
         # Verify injected patterns
         if self.patterns:
             stats["injected_patterns"] = []
-            for pattern in self.patterns:
-                actual_support = PatternInjector.verify_pattern(
-                    self.data,
-                    pattern["items"]
-                )
+            supports = PatternInjector.verify_patterns(
+                self.data,
+                [pattern["items"] for pattern in self.patterns]
+            )
+            for pattern, actual_support in zip(self.patterns, supports):
                 stats["injected_patterns"].append({
                     "id": pattern.get("id", "unknown"),
                     "items": pattern["items"],
                     "target_support": pattern["target_support"],
-                    "actual_support": actual_support
+                    "actual_support": float(actual_support)
                 })
         
         return stats
     
+    def to_packed(self) -> np.ndarray:
+        """
+        Get a bit-packed copy of the dataset.
+        
+        Each transaction is a row of ceil(num_items / 8) bytes in
+        np.packbits order (item j is bit 7 - j % 8 of byte j // 8), i.e. one
+        bit per cell instead of one byte for a dense int8 matrix. Use
+        np.unpackbits(packed, axis=1, count=num_items) to recover the
+        binary matrix.
+        
+        Returns:
+            uint8 array (num_transactions x ceil(num_items / 8))
+        """
+        if self.data is None:
+            raise RuntimeError("Data not generated yet. Call generate() first.")
+        
+        return PatternInjector.to_packed(self.data)
+    
     def to_spmf(self, filepath: str):
         """
         Save dataset in SPMF format.
@@ -173,33 +283,43 @@ class DataGenerator:
         
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            for transaction in self.data:
-                # Get items (column indices where value is 1)
-                items = np.where(transaction == 1)[0]
-                # Write as space-separated integers
-                f.write(" ".join(map(str, items)) + "\n")
+        # Flatten the CSR arrays to Python lists once and look every item up
+        # in the precomputed label table instead of formatting it per cell
+        bounds = self.data.indptr.tolist()
+        labels = list(map(self._item_labels.__getitem__, self.data.indices.tolist()))
+        
+        # Write raw bytes, one joined block of lines per write, so nothing
+        # is encoded per row and the file object sees few large writes
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            for start in range(0, self.num_transactions, self.SPMF_BLOCK_ROWS):
+                stop = min(start + self.SPMF_BLOCK_ROWS, self.num_transactions)
+                # Items of row r are labels[bounds[r]:bounds[r + 1]]
+                f.write(b"\n".join([
+                    b" ".join(labels[bounds[r]:bounds[r + 1]])
+                    for r in range(start, stop)
+                ]) + b"\n")
     
-    def to_csv(self, filepath: str):
+    def to_csv(self, filepath: str, chunk_rows: int = 10000):
         """
         Save dataset as CSV (binary matrix).
         
         Args:
             filepath: Output file path
+            chunk_rows: Number of rows densified and written at a time
         """
         if self.data is None:
             raise RuntimeError("Data not generated yet. Call generate() first.")
         
-        import pandas as pd
-        
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        df = pd.DataFrame(
-            self.data,
-            columns=[f"item_{i}" for i in range(self.num_items)]
-        )
-        df.to_csv(filepath, index=False)
-
+        header = ",".join(f"item_{i}" for i in range(self.num_items))
+        
+        with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(header + "\n")
+            # Only one block of rows is ever held as a dense array
+            for start in range(0, self.num_transactions, chunk_rows):
+                block = self.data[start:start + chunk_rows].toarray()
+                np.savetxt(f, block, fmt="%d", delimiter=",")
 
 if __name__ == "__main__":
     # Test data generation
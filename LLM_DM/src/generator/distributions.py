@@ -5,8 +5,56 @@ Provides statistical distribution functions for item frequency generation.
 """
 
 import numpy as np
-from typing import List, Dict, Any
-from scipy.stats import zipf, norm, expon
+from functools import lru_cache
+from scipy import special
+from typing import Any, Callable, Dict, List
+
+
+@lru_cache(maxsize=16)
+def _grid(num_items: int, lo: float, hi: float) -> np.ndarray:
+    """
+    Evenly spaced positions in [lo, hi], one per item.
+    
+    Cached because the same item count is requested on every generation;
+    the array is read-only since it is shared between callers.
+    """
+    grid = np.linspace(lo, hi, num_items)
+    grid.flags.writeable = False
+    return grid
+
+
+@lru_cache(maxsize=32)
+def _zipf_probs(num_items: int, alpha: float) -> np.ndarray:
+    """
+    Normalized Zipf probabilities, cached per (num_items, alpha).
+    
+    The returned array is read-only since it is shared between callers.
+    """
+    # Generate Zipf probabilities
+    # Higher rank = lower probability; r^-alpha computed as exp(-alpha * log r)
+    ranks = np.arange(1, num_items + 1, dtype=np.float64)
+    probs = np.exp(-alpha * np.log(ranks))
+    
+    # Normalize to sum to 1
+    probs *= 1.0 / _zipf_normalizer(num_items, alpha, probs)
+    probs.flags.writeable = False
+    return probs
+
+
+def _zipf_normalizer(num_items: int, alpha: float, probs: np.ndarray = None) -> float:
+    """
+    Generalized harmonic number H(num_items, alpha) = sum of k^-alpha.
+    
+    For alpha > 1 it is a difference of two Hurwitz zeta values, which
+    needs no (num_items,) array; otherwise the series diverges and the
+    terms are summed (from probs when given).
+    """
+    if alpha > 1.0:
+        return float(special.zeta(alpha, 1.0) - special.zeta(alpha, num_items + 1.0))
+    
+    if probs is None:
+        probs = np.exp(-alpha * np.log(np.arange(1, num_items + 1, dtype=np.float64)))
+    return float(probs.sum())
 
 
 class DistributionEngine:
@@ -50,6 +98,106 @@ class DistributionEngine:
         else:
             raise ValueError(f"Unknown distribution method: {method}")
     
+    @staticmethod
+    def compile(
+        num_items: int,
+        method: str = "zipf",
+        params: Dict[str, Any] = None
+    ) -> Callable[[], np.ndarray]:
+        """
+        Specialize generate_item_frequencies for a fixed configuration.
+        
+        Method dispatch and the computation run once, here; the returned
+        function just hands back the precomputed (read-only) probabilities.
+        
+        Args:
+            num_items: Number of unique items
+            method: Distribution method ("random", "zipf", "normal", "exponential")
+            params: Distribution-specific parameters
+        
+        Returns:
+            Function with no arguments returning the item probabilities
+        
+        Raises:
+            ValueError: If method is unknown
+        """
+        probs = DistributionEngine.generate_item_frequencies(num_items, method, params)
+        if probs.flags.writeable:
+            probs = probs.copy()
+            probs.flags.writeable = False
+        
+        def item_frequencies() -> np.ndarray:
+            return probs
+        
+        return item_frequencies
+    
+    @staticmethod
+    def sample_zipf(
+        num_items: int,
+        alpha: float,
+        size: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        Draw item IDs from a bounded Zipf distribution without building it.
+        
+        Uses rejection-inversion (Hormann & Derflinger, 1996): O(1) memory
+        and expected O(1) work per sample whatever num_items is, where
+        rng.choice(num_items, p=probs) needs the full O(num_items)
+        probability vector. Item k is drawn with probability proportional
+        to (k + 1)^-alpha, matching the "zipf" item frequencies.
+        
+        Args:
+            num_items: Number of unique items
+            alpha: Zipf parameter (> 0)
+            size: Number of samples
+            rng: Random generator
+        
+        Returns:
+            int64 array of item IDs in [0, num_items)
+        """
+        one_minus_alpha = 1.0 - alpha
+        
+        def expm1_ratio(x):
+            # (e^x - 1) / x, continuous at 0
+            safe = np.where(x == 0.0, 1.0, x)
+            return np.where(x == 0.0, 1.0, np.expm1(safe) / safe)
+        
+        def log1p_ratio(x):
+            # log(1 + x) / x, continuous at 0
+            safe = np.where(x == 0.0, 1.0, x)
+            return np.where(x == 0.0, 1.0, np.log1p(safe) / safe)
+        
+        def h(x):
+            return np.exp(-alpha * np.log(x))
+        
+        def h_integral(x):
+            # Antiderivative of h: (x^(1 - alpha) - 1) / (1 - alpha)
+            log_x = np.log(x)
+            return expm1_ratio(one_minus_alpha * log_x) * log_x
+        
+        def h_integral_inverse(x):
+            t = np.maximum(x * one_minus_alpha, -1.0)
+            return np.exp(log1p_ratio(t) * x)
+        
+        h_integral_x1 = h_integral(1.5) - 1.0
+        h_integral_n = h_integral(num_items + 0.5)
+        squeeze = 2.0 - h_integral_inverse(h_integral(2.5) - h(2.0))
+        
+        samples = np.empty(size, dtype=np.int64)
+        pending = np.arange(size)
+        
+        while pending.size:
+            u = h_integral_n + rng.random(pending.size) * (h_integral_x1 - h_integral_n)
+            x = h_integral_inverse(u)
+            k = np.clip(np.rint(x), 1, num_items)
+            
+            accept = (k - x <= squeeze) | (u >= h_integral(k + 0.5) - h(k))
+            samples[pending[accept]] = k[accept].astype(np.int64) - 1
+            pending = pending[~accept]
+        
+        return samples
+    
     @staticmethod
     def _random_distribution(num_items: int) -> np.ndarray:
         """Uniform random distribution."""
@@ -68,14 +216,7 @@ class DistributionEngine:
             params: {"alpha": float} - Zipf parameter (typically 1.0-2.0)
         """
         alpha = params.get("alpha", 1.1)
-        
-        # Generate Zipf probabilities
-        # Higher rank = lower probability
-        ranks = np.arange(1, num_items + 1)
-        probs = 1.0 / np.power(ranks, alpha)
-        
-        # Normalize to sum to 1
-        return probs / probs.sum()
+        return _zipf_probs(num_items, float(alpha))
     
     @staticmethod
     def _normal_distribution(num_items: int, params: Dict) -> np.ndarray:
@@ -89,13 +230,14 @@ class DistributionEngine:
         std = params.get("std", 0.2)
         
         # Generate positions normalized to [0, 1]
-        positions = np.linspace(0, 1, num_items)
+        positions = _grid(num_items, 0.0, 1.0)
         
-        # Compute Gaussian probabilities
-        probs = norm.pdf(positions, loc=mean, scale=std)
+        # Unnormalized Gaussian density: the 1/(std*sqrt(2*pi)) constant
+        # cancels in the normalization, and exp is never negative
+        inv_std = 1.0 / std
+        z = (positions - mean) * inv_std
+        probs = np.exp(-0.5 * z * z)
         
-        # Ensure no negative values and normalize
-        probs = np.maximum(probs, 0)
         return probs / probs.sum()
     
     @staticmethod
@@ -109,8 +251,9 @@ class DistributionEngine:
         scale = params.get("scale", 1.0)
         
         # Generate exponential probabilities
-        x = np.linspace(0, 5, num_items)  # 5 is arbitrary scale
-        probs = expon.pdf(x, scale=scale)
+        x = _grid(num_items, 0.0, 5.0)  # 5 is arbitrary scale
+        # The 1/scale density constant cancels in the normalization
+        probs = np.exp(-x * (1.0 / scale))
         
         return probs / probs.sum()
 
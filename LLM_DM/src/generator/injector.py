@@ -6,7 +6,11 @@ Ground Truth for benchmarking.
 """
 
 import numpy as np
-from typing import List, Dict, Set
+from scipy import sparse
+from typing import List, Dict, Optional, Set, Tuple, Union
+
+# Dense binary matrix or CSR matrix (as produced by DataGenerator)
+TransactionMatrix = Union[np.ndarray, sparse.csr_matrix]
 
 
 class PatternInjector:
@@ -17,29 +21,41 @@ class PatternInjector:
     allowing validation of pattern mining algorithm accuracy.
     """
     
-    def __init__(self, num_transactions: int, num_items: int):
+    def __init__(
+        self,
+        num_transactions: int,
+        num_items: int,
+        rng: Union[np.random.Generator, int, None] = None
+    ):
         """
         Initialize the pattern injector.
         
         Args:
             num_transactions: Total number of transactions in dataset
             num_items: Total number of unique items
+            rng: Random generator, or seed for a new one (for reproducibility)
         """
         self.num_transactions = num_transactions
         self.num_items = num_items
+        self.rng = np.random.default_rng(rng)
+        
+        # Reusable permutation of the transaction IDs and the identity it
+        # is reset from (see _choose_rows)
+        self._idx_buf: Optional[np.ndarray] = None
+        self._identity: Optional[np.ndarray] = None
     
     def inject_pattern(
         self,
-        data: np.ndarray,
+        data: TransactionMatrix,
         pattern_items: List[int],
         target_support: float,
         noise_ratio: float = 0.0
-    ) -> np.ndarray:
+    ) -> TransactionMatrix:
         """
         Inject a specific pattern into the dataset.
         
         Args:
-            data: Binary matrix (num_transactions x num_items)
+            data: Binary matrix (num_transactions x num_items), dense or CSR
             pattern_items: List of item IDs to inject together
             target_support: Desired support (0.0-1.0)
             noise_ratio: Probability of randomly omitting an item (0.0-1.0)
@@ -50,6 +66,54 @@ class PatternInjector:
         Raises:
             ValueError: If pattern_items are invalid
         """
+        rows, cols = self._sample_cells(pattern_items, target_support, noise_ratio)
+        if rows.size == 0:
+            return data  # Support too low, skip injection
+        
+        return self._set_entries(data, rows, cols)
+    
+    def inject_pattern_packed(
+        self,
+        packed: np.ndarray,
+        pattern_items: List[int],
+        target_support: float,
+        noise_ratio: float = 0.0
+    ) -> np.ndarray:
+        """
+        Inject a specific pattern into a bit-packed dataset (see to_packed).
+        
+        Draws the same cells as inject_pattern and ORs their bits in place.
+        
+        Args:
+            packed: uint8 bit matrix (num_transactions x ceil(num_items / 8))
+            pattern_items: List of item IDs to inject together
+            target_support: Desired support (0.0-1.0)
+            noise_ratio: Probability of randomly omitting an item (0.0-1.0)
+        
+        Returns:
+            The packed matrix with injected pattern
+        
+        Raises:
+            ValueError: If pattern_items are invalid
+        """
+        rows, cols = self._sample_cells(pattern_items, target_support, noise_ratio)
+        
+        bits = (0x80 >> (cols & 7)).astype(np.uint8)
+        np.bitwise_or.at(packed, (rows, cols >> 3), bits)
+        return packed
+    
+    def _sample_cells(
+        self,
+        pattern_items: List[int],
+        target_support: float,
+        noise_ratio: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate a pattern and draw the (row, column) cells to set for it.
+        
+        Returns:
+            Tuple (rows, cols) of index arrays
+        """
         # Validate inputs
         if not pattern_items:
             raise ValueError("pattern_items cannot be empty")
@@ -77,34 +141,86 @@ class PatternInjector:
             num_injections = int(self.num_transactions * target_support)
         
         if num_injections == 0:
-            return data  # Support too low, skip injection
+            # Support too low, skip injection
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
         
         # Randomly select transactions to inject pattern into
-        transaction_indices = np.random.choice(
-            self.num_transactions,
-            size=num_injections,
-            replace=False
-        )
+        transaction_indices = self._choose_rows(num_injections)
+        
+        # Apply noise: draw one keep/skip decision per (transaction, item)
+        # cell, in the same order the per-cell loop used to draw them
+        pattern_items = np.asarray(pattern_items)
+        keep = (self.rng.random((num_injections, len(pattern_items))) > noise_ratio).ravel()
         
-        # Inject pattern
-        for trans_idx in transaction_indices:
-            for item in pattern_items:
-                # Apply noise: sometimes skip an item
-                if np.random.random() > noise_ratio:
-                    data[trans_idx, item] = 1
+        rows = np.repeat(transaction_indices, len(pattern_items))[keep]
+        cols = np.tile(pattern_items, num_injections)[keep]
+        
+        return rows, cols
+    
+    def _choose_rows(self, k: int) -> np.ndarray:
+        """
+        Draw k distinct transaction IDs.
+        
+        The returned array may be a view of an internal buffer that the
+        next call overwrites, so callers must copy what they keep.
+        """
+        if 2 * k <= self.num_transactions:
+            # Their order is irrelevant, so skip the final shuffle;
+            # Generator.choice already switches to Floyd's O(k) set
+            # sampling for small draws
+            return self.rng.choice(
+                self.num_transactions,
+                size=k,
+                replace=False,
+                shuffle=False
+            )
         
-        return data
+        # Large draws: shuffle one persistent buffer in place instead of
+        # allocating a fresh arange(num_transactions) per pattern. It is
+        # reset to the identity first, so the rows drawn depend only on the
+        # generator state (the same seed gives the same rows)
+        if self._idx_buf is None:
+            self._identity = np.arange(self.num_transactions)
+            self._idx_buf = np.empty_like(self._identity)
+        np.copyto(self._idx_buf, self._identity)
+        self.rng.shuffle(self._idx_buf)
+        return self._idx_buf[:k]
+    
+    def _set_entries(
+        self,
+        data: TransactionMatrix,
+        rows: np.ndarray,
+        cols: np.ndarray
+    ) -> TransactionMatrix:
+        """
+        Set data[rows, cols] = 1 on a dense or CSR matrix.
+        
+        Dense arrays are modified in place. CSR matrices are merged with
+        the new cells in one operation instead of inserting them one by one.
+        """
+        if not sparse.issparse(data):
+            data[rows, cols] = 1
+            return data
+        
+        # Drop duplicate cells so the merge never produces values above 1
+        cells = np.unique(rows.astype(np.int64) * self.num_items + cols)
+        added = sparse.csr_matrix(
+            (np.ones(cells.size, dtype=data.dtype),
+             (cells // self.num_items, cells % self.num_items)),
+            shape=data.shape
+        )
+        return data.maximum(added).tocsr()
     
     def inject_multiple_patterns(
         self,
-        data: np.ndarray,
+        data: TransactionMatrix,
         patterns: List[Dict]
-    ) -> np.ndarray:
+    ) -> TransactionMatrix:
         """
         Inject multiple patterns sequentially.
         
         Args:
-            data: Binary matrix (num_transactions x num_items)
+            data: Binary matrix (num_transactions x num_items), dense or CSR
             patterns: List of pattern dictionaries with keys:
                      - "items": List[int]
                      - "target_support": float
@@ -113,25 +229,36 @@ class PatternInjector:
         Returns:
             Modified data matrix with all patterns injected
         """
+        # Draw the cells of every pattern, then write them all at once
+        all_rows, all_cols = [], []
         for pattern in patterns:
             items = pattern["items"]
             support = pattern["target_support"]
             noise = pattern.get("noise_ratio", 0.0)
             
-            data = self.inject_pattern(data, items, support, noise)
+            rows, cols = self._sample_cells(items, support, noise)
+            all_rows.append(rows)
+            all_cols.append(cols)
         
-        return data
+        if not all_rows:
+            return data
+        
+        return self._set_entries(data, np.concatenate(all_rows), np.concatenate(all_cols))
     
     @staticmethod
     def verify_pattern(
-        data: np.ndarray,
+        data: TransactionMatrix,
         pattern_items: List[int]
     ) -> float:
         """
         Verify the actual support of a pattern in the data.
         
+        Dense matrices should use a 1-byte dtype (bool, int8 or uint8, as
+        DataGenerator does): their 0/1 columns are then read as bool views
+        without any comparison pass.
+        
         Args:
-            data: Binary matrix (num_transactions x num_items)
+            data: Binary matrix (num_transactions x num_items), dense or CSR
             pattern_items: List of item IDs to check
         
         Returns:
@@ -140,33 +267,214 @@ class PatternInjector:
         if not pattern_items:
             return 0.0
         
-        # Check each transaction
+        if sparse.issparse(data):
+            # A transaction contains the pattern when it stores every column
+            counts = data[:, pattern_items].getnnz(axis=1)
+            return np.count_nonzero(counts == len(pattern_items)) / data.shape[0]
+        
+        # Check each transaction, reusing one column buffer so the loop
+        # allocates nothing per item
+        byte_cells = data.dtype.itemsize == 1
         contains_pattern = np.ones(data.shape[0], dtype=bool)
+        if not byte_cells:
+            has_item = np.empty(data.shape[0], dtype=bool)
         
         for item in pattern_items:
-            contains_pattern &= (data[:, item] == 1)
+            if byte_cells:
+                # 0/1 bytes are valid bools: zero-copy view of the column
+                has_item = data[:, item].view(bool)
+            else:
+                np.equal(data[:, item], 1, out=has_item)
+            np.logical_and(contains_pattern, has_item, out=contains_pattern)
+        
+        return np.count_nonzero(contains_pattern) / data.shape[0]
+    
+    @staticmethod
+    def verify_patterns(
+        data: TransactionMatrix,
+        patterns_items: List[List[int]]
+    ) -> np.ndarray:
+        """
+        Verify the actual support of several patterns at once.
+        
+        Builds a pattern-by-item indicator matrix P; data @ P.T counts how
+        many items of each pattern every transaction holds, so all supports
+        come from a single (sparse x dense) matrix product.
         
-        return contains_pattern.sum() / data.shape[0]
+        Args:
+            data: Binary matrix (num_transactions x num_items), dense or CSR
+            patterns_items: Item IDs of each pattern
+        
+        Returns:
+            Array of actual supports, one per pattern
+        """
+        indicator = np.zeros((len(patterns_items), data.shape[1]), dtype=np.int32)
+        for k, items in enumerate(patterns_items):
+            indicator[k, items] = 1
+        pattern_lengths = indicator.sum(axis=1)
+        
+        hits = np.asarray(data @ indicator.T)
+        supports = (hits == pattern_lengths).sum(axis=0) / data.shape[0]
+        
+        # Same convention as verify_pattern for empty patterns
+        supports[pattern_lengths == 0] = 0.0
+        return supports
+    
+    @staticmethod
+    def to_packed(data: TransactionMatrix) -> np.ndarray:
+        """
+        Pack a binary matrix into one bit per cell.
+        
+        Each transaction becomes a row of ceil(num_items / 8) bytes in
+        np.packbits order: item j is bit 7 - j % 8 of byte j // 8.
+        
+        Args:
+            data: Binary matrix (num_transactions x num_items), dense or CSR
+        
+        Returns:
+            uint8 array (num_transactions x ceil(num_items / 8))
+        """
+        if not sparse.issparse(data):
+            return np.packbits(np.asarray(data, dtype=bool), axis=1)
+        
+        num_bytes = (data.shape[1] + 7) // 8
+        packed = np.zeros((data.shape[0], num_bytes), dtype=np.uint8)
+        
+        # Set the bits straight from the CSR arrays, without a dense copy
+        rows = np.repeat(np.arange(data.shape[0]), np.diff(data.indptr))
+        cols = data.indices
+        bits = (0x80 >> (cols & 7)).astype(np.uint8)
+        np.bitwise_or.at(packed, (rows, cols >> 3), bits)
+        
+        return packed
+    
+    @staticmethod
+    def from_packed(packed: np.ndarray, num_items: int) -> np.ndarray:
+        """
+        Unpack a bit-packed matrix (see to_packed) into a dense int8 matrix.
+        
+        Args:
+            packed: uint8 bit matrix (num_transactions x ceil(num_items / 8))
+            num_items: Number of items (bits) per transaction
+        
+        Returns:
+            int8 array (num_transactions x num_items)
+        """
+        return np.unpackbits(packed, axis=1, count=num_items).view(np.int8)
+    
+    @staticmethod
+    def verify_pattern_packed(
+        packed: np.ndarray,
+        pattern_items: List[int]
+    ) -> float:
+        """
+        Verify the actual support of a pattern in a bit-packed matrix.
+        
+        Pattern items are grouped by byte, so each byte column is read once
+        and tested against all of its pattern bits with a single AND.
+        
+        Args:
+            packed: uint8 bit matrix (num_transactions x ceil(num_items / 8))
+            pattern_items: List of item IDs to check
+        
+        Returns:
+            Actual support (fraction of transactions containing all items)
+        """
+        if not pattern_items:
+            return 0.0
+        
+        items = np.asarray(pattern_items)
+        masks = np.zeros(packed.shape[1], dtype=np.uint8)
+        np.bitwise_or.at(masks, items >> 3, (0x80 >> (items & 7)).astype(np.uint8))
+        
+        contains_pattern = np.ones(packed.shape[0], dtype=bool)
+        for byte in np.flatnonzero(masks):
+            contains_pattern &= (packed[:, byte] & masks[byte]) == masks[byte]
+        
+        return np.count_nonzero(contains_pattern) / packed.shape[0]
+    
+    @staticmethod
+    def to_tidsets(data: TransactionMatrix) -> np.ndarray:
+        """
+        Build the vertical bitset layout of a binary matrix.
+        
+        Row j holds the tidset of item j: bit t % 64 of word t // 64 is set
+        when transaction t contains the item. Supports then reduce to ANDs
+        of whole 64-transaction words and a popcount.
+        
+        Args:
+            data: Binary matrix (num_transactions x num_items), dense or CSR
+        
+        Returns:
+            uint64 array (num_items x ceil(num_transactions / 64))
+        """
+        num_words = (data.shape[0] + 63) // 64
+        tidsets = np.zeros((data.shape[1], num_words), dtype=np.uint64)
+        
+        if sparse.issparse(data):
+            rows = np.repeat(np.arange(data.shape[0]), np.diff(data.indptr))
+            cols = data.indices
+        else:
+            rows, cols = np.nonzero(data)
+        
+        bits = np.left_shift(np.uint64(1), (rows & 63).astype(np.uint64))
+        np.bitwise_or.at(tidsets, (cols, rows >> 6), bits)
+        return tidsets
+    
+    @staticmethod
+    def verify_pattern_tidsets(
+        tidsets: np.ndarray,
+        pattern_items: List[int],
+        num_transactions: int
+    ) -> float:
+        """
+        Verify the actual support of a pattern from item tidsets.
+        
+        Args:
+            tidsets: uint64 tidsets as returned by to_tidsets
+            pattern_items: List of item IDs to check
+            num_transactions: Total number of transactions
+        
+        Returns:
+            Actual support (fraction of transactions containing all items)
+        """
+        if not pattern_items:
+            return 0.0
+        
+        # Transactions holding every item, 64 per word
+        common = np.bitwise_and.reduce(tidsets[pattern_items], axis=0)
+        return _popcount(common) / num_transactions
+
+
+# Number of set bits in every byte value (popcount fallback for NumPy < 2)
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(words: np.ndarray) -> int:
+    """Total number of set bits in an unsigned integer array."""
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum(dtype=np.int64))
+    return int(_BYTE_POPCOUNT[words.view(np.uint8)].sum(dtype=np.int64))
 
 
 if __name__ == "__main__":
     # Test pattern injection
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     num_trans = 1000
     num_items = 50
     
     # Create empty dataset
-    data = np.zeros((num_trans, num_items), dtype=int)
+    data = np.zeros((num_trans, num_items), dtype=np.uint8)
     
     # Add some random noise
     for i in range(num_trans):
-        num_random_items = np.random.randint(2, 8)
-        random_items = np.random.choice(num_items, num_random_items, replace=False)
+        num_random_items = rng.integers(2, 8)
+        random_items = rng.choice(num_items, num_random_items, replace=False)
         data[i, random_items] = 1
     
     # Inject a pattern
-    injector = PatternInjector(num_trans, num_items)
+    injector = PatternInjector(num_trans, num_items, rng=rng)
     pattern = [5, 10, 15]
     target_support = 0.1
     
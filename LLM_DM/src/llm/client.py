@@ -6,18 +6,51 @@ Manages communication with Language Model APIs (OpenAI, HuggingFace, etc.)
 
 import os
 import json
-from typing import Dict, Optional
+import asyncio
+import functools
+import hashlib
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 try:
-    from openai import OpenAI
+    import orjson
 except ImportError:
-    OpenAI = None
+    orjson = None
 
-from dotenv import load_dotenv
+# Environment variables (.env) are loaded once, by the first client
+_env_loaded = False
 
-# Load environment variables
-load_dotenv()
+
+def _load_env():
+    """Load the .env file on first use."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+# Responses are cached on disk, keyed on everything that determines them
+CACHE_DIR = Path.home() / ".cache" / "fidd-bench" / "llm"
+
+
+def _import_openai():
+    """
+    Import the OpenAI client classes on first use.
+    
+    The openai package is slow to import, so it is only loaded when a
+    client is actually created.
+    
+    Returns:
+        Tuple (OpenAI, AsyncOpenAI)
+    """
+    try:
+        from openai import OpenAI, AsyncOpenAI
+    except ImportError:
+        raise ImportError(
+            "OpenAI package not installed. Run: pip install openai"
+        )
+    return OpenAI, AsyncOpenAI
 
 
 class LLMClient:
@@ -37,7 +70,8 @@ class LLMClient:
         model: str = None,
         temperature: float = 0.3,
         max_tokens: int = 2000,
-        timeout: int = 30
+        timeout: int = 30,
+        use_cache: bool = False
     ):
         """
         Initialize the LLM client.
@@ -48,11 +82,21 @@ class LLMClient:
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens in response
             timeout: API request timeout in seconds
+            use_cache: Reuse responses cached in CACHE_DIR for identical
+                       requests. Off by default: cached responses never
+                       expire, so every later call would return the first
+                       sample instead of drawing a new one
         """
         self.provider = provider.lower()
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.use_cache = use_cache
+        
+        _load_env()
+        
+        # System prompts by resolved path: (mtime_ns, content)
+        self._prompt_cache: Dict[Path, Tuple[int, str]] = {}
         
         if self.provider == "openai":
             self._init_openai(model)
@@ -63,10 +107,7 @@ class LLMClient:
     
     def _init_openai(self, model: Optional[str]):
         """Initialize OpenAI client."""
-        if OpenAI is None:
-            raise ImportError(
-                "OpenAI package not installed. Run: pip install openai"
-            )
+        OpenAI, AsyncOpenAI = _import_openai()
         
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -76,14 +117,16 @@ class LLMClient:
             )
         
         self.client = OpenAI(api_key=api_key, timeout=self.timeout)
+        self._async_client_factory = functools.partial(
+            AsyncOpenAI,
+            api_key=api_key,
+            timeout=self.timeout
+        )
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
     def _init_deepseek(self, model: Optional[str]):
         """Initialize DeepSeek client (uses OpenAI-compatible API)."""
-        if OpenAI is None:
-            raise ImportError(
-                "OpenAI package not installed. Run: pip install openai"
-            )
+        OpenAI, AsyncOpenAI = _import_openai()
         
         api_key = os.getenv("DEEPSEEK_API_KEY")
         if not api_key:
@@ -100,6 +143,12 @@ class LLMClient:
             base_url=base_url,
             timeout=self.timeout
         )
+        self._async_client_factory = functools.partial(
+            AsyncOpenAI,
+            api_key=api_key,
+            base_url=base_url,
+            timeout=self.timeout
+        )
         self.model = model or os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
     
     def generate_config(
@@ -121,41 +170,195 @@ class LLMClient:
             ValueError: If LLM response is invalid
             Exception: If API call fails
         """
-        # Load system prompt
-        if system_prompt_path is None:
-            # Default to generation.txt in config/prompts
-            system_prompt_path = Path(__file__).parent.parent.parent / "config" / "prompts" / "generation.txt"
+        system_prompt = self._load_system_prompt(system_prompt_path)
         
-        with open(system_prompt_path, "r", encoding="utf-8") as f:
-            system_prompt = f.read()
+        cache_path = self._cache_path(system_prompt, user_prompt)
+        config = self._read_cache(cache_path)
+        if config is not None:
+            return config
         
         # Call LLM
         try:
             if self.provider in ["openai", "deepseek"]:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                    response_format={"type": "json_object"}  # Force JSON output
+                stream = self.client.chat.completions.create(
+                    **self._request_kwargs(system_prompt, user_prompt)
                 )
                 
-                content = response.choices[0].message.content
+                content = "".join(map(self._chunk_text, stream))
             else:
                 raise NotImplementedError(f"Provider {self.provider} not implemented")
             
-            # Parse JSON
-            try:
-                config = json.loads(content)
-                return config
-            except json.JSONDecodeError as e:
-                raise ValueError(f"LLM returned invalid JSON: {e}\nContent: {content}")
+            config = self._parse_content(content)
         
         except Exception as e:
             raise Exception(f"LLM API call failed: {str(e)}")
+        
+        self._write_cache(cache_path, config)
+        return config
+    
+    async def generate_config_async(
+        self,
+        user_prompt: str,
+        system_prompt_path: Optional[str] = None
+    ) -> Dict:
+        """
+        Asynchronous version of generate_config.
+        
+        Args:
+            user_prompt: User's natural language request
+            system_prompt_path: Path to system prompt file (optional)
+        
+        Returns:
+            Dict containing the parsed configuration
+        
+        Raises:
+            ValueError: If LLM response is invalid
+            Exception: If API call fails
+        """
+        # The async client's connection pool is bound to the running event
+        # loop, so it is opened and closed within this call
+        async with self._async_client_factory() as client:
+            return await self._generate_async(client, user_prompt, system_prompt_path)
+    
+    async def _generate_async(
+        self,
+        client,
+        user_prompt: str,
+        system_prompt_path: Optional[str]
+    ) -> Dict:
+        """generate_config_async using an open AsyncOpenAI client."""
+        system_prompt = self._load_system_prompt(system_prompt_path)
+        
+        cache_path = self._cache_path(system_prompt, user_prompt)
+        config = self._read_cache(cache_path)
+        if config is not None:
+            return config
+        
+        try:
+            if self.provider in ["openai", "deepseek"]:
+                stream = await client.chat.completions.create(
+                    **self._request_kwargs(system_prompt, user_prompt)
+                )
+                
+                content = "".join([self._chunk_text(chunk) async for chunk in stream])
+            else:
+                raise NotImplementedError(f"Provider {self.provider} not implemented")
+            
+            config = self._parse_content(content)
+        
+        except Exception as e:
+            raise Exception(f"LLM API call failed: {str(e)}")
+        
+        self._write_cache(cache_path, config)
+        return config
+    
+    def generate_configs(
+        self,
+        user_prompts: List[str],
+        system_prompt_path: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Generate configurations for several prompts concurrently.
+        
+        Requests are sent in parallel, so the batch takes about as long as
+        the slowest request instead of the sum of all of them.
+        
+        Args:
+            user_prompts: Natural language requests
+            system_prompt_path: Path to system prompt file (optional)
+        
+        Returns:
+            List of configurations, in the order of user_prompts
+        """
+        # One client per batch: it is created and closed in the event loop
+        # of this asyncio.run call, and shared by all of its requests
+        async def gather():
+            async with self._async_client_factory() as client:
+                return await asyncio.gather(*(
+                    self._generate_async(client, prompt, system_prompt_path)
+                    for prompt in user_prompts
+                ))
+        
+        return list(asyncio.run(gather()))
+    
+    def _load_system_prompt(self, system_prompt_path: Optional[str]) -> str:
+        """Read the system prompt (defaults to config/prompts/generation.txt)."""
+        if system_prompt_path is None:
+            # Default to generation.txt in config/prompts
+            system_prompt_path = Path(__file__).parent.parent.parent / "config" / "prompts" / "generation.txt"
+        
+        # Re-read the file only when it has changed since the last call
+        path = Path(system_prompt_path).resolve()
+        mtime = path.stat().st_mtime_ns
+        cached = self._prompt_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, path.read_text(encoding="utf-8"))
+            self._prompt_cache[path] = cached
+        return cached[1]
+    
+    def _request_kwargs(self, system_prompt: str, user_prompt: str) -> Dict:
+        """Arguments of a chat completion request."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "response_format": {"type": "json_object"},  # Force JSON output
+            # Receive the response as it is generated instead of in one block
+            "stream": True
+        }
+    
+    @staticmethod
+    def _chunk_text(chunk) -> str:
+        """Text carried by one streamed completion chunk."""
+        if not chunk.choices:
+            return ""
+        return chunk.choices[0].delta.content or ""
+    
+    @staticmethod
+    def _parse_content(content: str) -> Dict:
+        """Parse the JSON configuration returned by the LLM."""
+        try:
+            if orjson is not None:
+                return orjson.loads(content)
+            return json.loads(content)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+            raise ValueError(f"LLM returned invalid JSON: {e}\nContent: {content}")
+    
+    def _cache_path(self, system_prompt: str, user_prompt: str) -> Path:
+        """Cache file of a request, addressed by a hash of its inputs."""
+        key = hashlib.blake2b(digest_size=16)
+        for part in (self.provider, self.model, system_prompt, user_prompt,
+                     repr(self.temperature), repr(self.max_tokens)):
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        return CACHE_DIR / f"{key.hexdigest()}.json"
+    
+    def _read_cache(self, cache_path: Path) -> Optional[Dict]:
+        """Return the cached configuration, or None on a miss."""
+        if not self.use_cache:
+            return None
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def _write_cache(self, cache_path: Path, config: Dict):
+        """Store a configuration; caching failures are not fatal."""
+        if not self.use_cache:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(config, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
     
     def validate_and_fix_config(self, config: Dict) -> Dict:
         """
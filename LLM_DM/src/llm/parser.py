@@ -242,10 +242,13 @@ class ConfigParser:
         Returns:
             Validated configuration dictionary
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        # FileIO decodes with orjson when it is installed; imported here so
+        # the module still runs on its own (python src/llm/parser.py)
+        from utils.file_io import FileIO
         
-        parser = ConfigParser(strict_mode=strict_mode)
+        config = FileIO.read_json(filepath)
+        
+        parser = default_parser if strict_mode else ConfigParser(strict_mode=False)
         return parser.parse(config)
     
     @staticmethod
@@ -262,6 +265,10 @@ class ConfigParser:
             json.dump(config, f, indent=2, ensure_ascii=False)
 
 
+# Shared strict parser (parsers hold no state besides strict_mode)
+default_parser = ConfigParser()
+
+
 if __name__ == "__main__":
     # Test with example config
     test_config = {
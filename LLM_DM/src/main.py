@@ -6,6 +6,7 @@ Command-line interface for generating synthetic datasets and running benchmarks.
 
 import click
 import json
+import numpy as np
 import sys
 from pathlib import Path
 from typing import Optional
@@ -13,11 +14,10 @@ from typing import Optional
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from llm.client import LLMClient
+# LLMClient, SPMFRunner and MetricsCalculator are imported inside the
+# commands that use them, so --help and LLM-free runs start faster
 from llm.parser import ConfigParser
 from generator.core import DataGenerator
-from benchmark.spmf_runner import SPMFRunner
-from benchmark.metrics import MetricsCalculator
 from utils.file_io import FileIO, load_config
 from utils.logger import setup_logger
 
@@ -55,8 +55,9 @@ def cli(ctx, verbose, config):
 @click.option('--save-config', type=click.Path(), help='Save generated config to file')
 @click.option('--seed', type=int, help='Random seed for reproducibility')
 @click.option('--stats', is_flag=True, help='Print dataset statistics')
+@click.option('--llm-cache', is_flag=True, help='Reuse cached LLM responses for identical prompts')
 @click.pass_context
-def generate(ctx, prompt, output, config_json, save_config, seed, stats):
+def generate(ctx, prompt, output, config_json, save_config, seed, stats, llm_cache):
     """
     Generate a synthetic dataset from natural language description or JSON config.
     
@@ -82,11 +83,14 @@ def generate(ctx, prompt, output, config_json, save_config, seed, stats):
             config = ConfigParser.from_file(config_json)
         else:
             logger.info("Parsing natural language prompt with LLM...")
+            from llm.client import LLMClient
+            
             llm_config = ctx.obj['config'].get('llm', {})
             client = LLMClient(
                 provider=llm_config.get('provider', 'openai'),
                 model=llm_config.get('model'),
-                temperature=llm_config.get('temperature', 0.3)
+                temperature=llm_config.get('temperature', 0.3),
+                use_cache=llm_cache
             )
             
             raw_config = client.generate_config(prompt)
@@ -104,7 +108,8 @@ def generate(ctx, prompt, output, config_json, save_config, seed, stats):
         # Step 2: Generate data
         logger.info("Generating dataset...")
         generator = DataGenerator(config)
-        data = generator.generate(seed=seed)
+        rng = np.random.default_rng(seed)
+        data = generator.generate(seed=rng)
         
         # Step 3: Save to file
         logger.info(f"Saving dataset to {output}...")
@@ -160,6 +165,8 @@ def benchmark(ctx, input, algorithm, min_support, output, ground_truth):
         if not output:
             output = f"output_{algorithm}_{min_support}.txt"
         
+        from benchmark.spmf_runner import SPMFRunner
+        
         # Initialize SPMF runner
         spmf_config = ctx.obj['config'].get('benchmark', {})
         jar_path = spmf_config.get('spmf_jar_path', './lib/spmf.jar')
@@ -178,17 +185,15 @@ def benchmark(ctx, input, algorithm, min_support, output, ground_truth):
         )
         
         # Display results
-        click.echo("\n" + "="*60)
-        click.echo(f"Benchmark Results: {algorithm}")
-        click.echo("="*60)
-        click.echo(f"Execution Time: {result['execution_time']:.4f}s")
-        click.echo(f"Patterns Found: {result.get('num_patterns_found', 'N/A')}")
+        _echo_benchmark_result(algorithm, result)
         
         # Calculate accuracy if ground truth provided
         if ground_truth:
             gt_data = FileIO.read_json(ground_truth)
             gt_patterns = gt_data.get('pattern_injection', [])
             
+            from benchmark.metrics import MetricsCalculator
+            
             found_patterns = runner.parse_output(output)
             
             calculator = MetricsCalculator(ground_truth=gt_patterns)
@@ -209,6 +214,15 @@ def benchmark(ctx, input, algorithm, min_support, output, ground_truth):
         sys.exit(1)
 
 
+def _echo_benchmark_result(algorithm: str, result: dict):
+    """Print the header and execution metrics of one benchmark run."""
+    click.echo("\n" + "="*60)
+    click.echo(f"Benchmark Results: {algorithm}")
+    click.echo("="*60)
+    click.echo(f"Execution Time: {result['execution_time']:.4f}s")
+    click.echo(f"Patterns Found: {result.get('num_patterns_found', 'N/A')}")
+
+
 @cli.command()
 @click.option('--prompt', '-p', required=True, help='Natural language description')
 @click.option('--dataset', '-d', type=click.Path(), help='Dataset output path')
@@ -238,21 +252,44 @@ def full_pipeline(ctx, prompt, dataset, algorithms, min_support, report, seed):
     # Generate dataset
     ctx.invoke(generate, prompt=prompt, output=dataset, seed=seed, stats=True)
     
-    # Run benchmarks
-    results = []
-    for algo in algorithms:
-        try:
-            output_file = f"data/benchmarks/{algo}_output.txt"
-            ctx.invoke(
-                benchmark,
-                input=dataset,
-                algorithm=algo,
-                min_support=min_support,
-                output=output_file
-            )
-            # results.append(result)  # Would collect for comparison
-        except Exception as e:
-            logger.error(f"Algorithm {algo} failed: {e}")
+    # Run benchmarks: each one waits on its own SPMF (JVM) subprocess, so
+    # run_many overlaps them in threads; results are printed afterwards, in
+    # algorithm order, and a failing algorithm does not stop the others
+    from benchmark.spmf_runner import SPMFRunner
+    
+    spmf_config = ctx.obj['config'].get('benchmark', {})
+    try:
+        runner = SPMFRunner(
+            spmf_config.get('spmf_jar_path', './lib/spmf.jar'),
+            spmf_config.get('java_memory', '4g')
+        )
+    except Exception as e:
+        logger.error(f"Benchmark setup failed: {e}", exc_info=True)
+        click.echo(f"✗ Error: {e}", err=True)
+        sys.exit(1)
+    
+    jobs = [
+        {
+            "algorithm": algo,
+            "input_file": dataset,
+            "output_file": f"data/benchmarks/{algo}_output.txt",
+            "min_support": min_support,
+            "timeout": spmf_config.get('timeout', 300)
+        }
+        for algo in algorithms
+    ]
+    results = runner.run_many(jobs, return_exceptions=True)
+    
+    for job, result in zip(jobs, results):
+        algo = job["algorithm"]
+        if isinstance(result, Exception):
+            logger.error(f"Algorithm {algo} failed: {result}")
+            click.echo(f"✗ {algo} failed: {result}", err=True)
+            continue
+        
+        _echo_benchmark_result(algo, result)
+        click.echo("="*60 + "\n")
+        click.echo(f"✓ Benchmark completed: {job['output_file']}", err=False)
     
     click.echo("\n✓ Full pipeline completed!", err=False)
 
@@ -0,0 +1,180 @@
+"""
+SPMF Tokenizer
+
+Vectorized parser turning the raw bytes of an SPMF file into item IDs, and
+the matching formatter turning item IDs back into SPMF bytes.
+"""
+
+import numpy as np
+from typing import Tuple
+
+_NEWLINE = ord("\n")
+_SPACE = ord(" ")
+_ZERO = ord("0")
+
+# Bytes parse_spmf handles at a time (rounded to whole lines)
+CHUNK_BYTES = 1 << 20
+
+# Byte classes: digits, and everything allowed in an SPMF transaction file
+_DIGIT = np.zeros(256, dtype=bool)
+_DIGIT[_ZERO:_ZERO + 10] = True
+_VALID = _DIGIT.copy()
+_VALID[list(b" \t\r\n")] = True
+
+# 10, 100, ..., 10^18: item i has 1 + searchsorted(_POW10, i, "right") digits
+_POW10 = np.power(10, np.arange(1, 19), dtype=np.int64)
+
+
+def parse_spmf(buf: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the contents of an SPMF file in a few array passes.
+    
+    Items are runs of ASCII digits separated by spaces or tabs; newlines
+    end transactions and empty lines are skipped. The buffer is processed
+    in newline-aligned chunks of about CHUNK_BYTES, so temporaries stay
+    small next to a large (e.g. memory-mapped) file.
+    
+    Args:
+        buf: File contents as a uint8 array (e.g. np.frombuffer of the bytes)
+    
+    Returns:
+        Tuple (items, offsets): int64 item IDs of all transactions, and
+        offsets such that transaction r is items[offsets[r]:offsets[r + 1]]
+    
+    Raises:
+        ValueError: On any other byte (e.g. "-1" separators, "#SUP:"
+            annotations or decimals), or an item ID above 18 digits
+    """
+    item_chunks = []
+    count_chunks = []
+    lines_before = 0
+    
+    start = 0
+    while start < buf.size:
+        # Extend the chunk up to its last newline (or the end of buf)
+        stop = min(start + CHUNK_BYTES, buf.size)
+        newlines = np.flatnonzero(buf[start:stop] == _NEWLINE)
+        while stop < buf.size and newlines.size == 0:
+            stop = min(stop + CHUNK_BYTES, buf.size)
+            newlines = np.flatnonzero(buf[start:stop] == _NEWLINE)
+        if stop < buf.size:
+            stop = start + int(newlines[-1]) + 1
+        
+        items, counts = _parse_chunk(buf[start:stop], newlines, lines_before)
+        item_chunks.append(items)
+        count_chunks.append(counts)
+        lines_before += newlines.size
+        start = stop
+    
+    if not item_chunks:
+        return np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    
+    counts = np.concatenate(count_chunks)
+    offsets = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return np.concatenate(item_chunks), offsets
+
+
+def _parse_chunk(
+    chunk: np.ndarray,
+    newlines: np.ndarray,
+    lines_before: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse whole lines of SPMF text.
+    
+    Args:
+        chunk: uint8 bytes of whole lines (the last may lack its newline)
+        newlines: Positions of the newlines in chunk
+        lines_before: Number of lines before chunk (for error messages)
+    
+    Returns:
+        Tuple (items, counts): item IDs, and item counts of non-empty lines
+    """
+    invalid = ~_VALID[chunk]
+    if invalid.any():
+        pos = int(np.argmax(invalid))
+        line = lines_before + int(np.searchsorted(newlines, pos)) + 1
+        raise ValueError(
+            f"Invalid byte {bytes(chunk[pos:pos + 1])!r} on line {line} of SPMF data"
+        )
+    
+    # Digit runs start and end where is_digit changes
+    is_digit = _DIGIT[chunk]
+    edges = np.flatnonzero(np.diff(is_digit, prepend=False, append=False))
+    starts = edges[0::2]
+    lengths = edges[1::2] - starts
+    
+    max_len = int(lengths.max(initial=0))
+    if max_len > 18:
+        pos = int(starts[np.argmax(lengths)])
+        line = lines_before + int(np.searchsorted(newlines, pos)) + 1
+        raise ValueError(f"Item ID too large on line {line} of SPMF data")
+    
+    # Accumulate digits left to right, over the tokens still that long
+    items = np.zeros(starts.size, dtype=np.int64)
+    active = np.arange(starts.size)
+    for k in range(max_len):
+        if k:
+            active = active[lengths[active] > k]
+        items[active] = items[active] * 10 + (chunk[starts[active] + k] - _ZERO)
+    
+    # Line of each token: newlines before its first digit
+    line_of_token = np.searchsorted(newlines, starts, side="right")
+    counts = np.bincount(line_of_token)
+    return items, counts[counts > 0]
+
+
+def format_spmf(items: np.ndarray, indptr: np.ndarray) -> bytes:
+    """
+    Format CSR transactions as SPMF lines in a few array passes.
+    
+    Every item is written as its decimal digits straight into one uint8
+    buffer, one digit position at a time over all items, so no Python
+    string is built per item or per row. Empty transactions give empty
+    lines, as in FileIO.write_spmf.
+    
+    Args:
+        items: Non-negative integer item IDs of all transactions
+        indptr: Offsets such that transaction r is items[indptr[r]:indptr[r + 1]]
+    
+    Returns:
+        SPMF text (one newline-terminated line per transaction) as bytes
+    """
+    items = np.asarray(items, dtype=np.int64)
+    indptr = np.asarray(indptr, dtype=np.int64)
+    if items.size and items.min() < 0:
+        raise ValueError("SPMF item IDs must be non-negative")
+    
+    num_digits = 1 + np.searchsorted(_POW10, items, side="right")
+    row_lengths = np.diff(indptr)
+    empty = row_lengths == 0
+    
+    # Each item takes its digits plus one separator; an empty row takes a
+    # single newline, placed after the bytes of all earlier rows
+    token_bytes = np.zeros(items.size + 1, dtype=np.int64)
+    np.cumsum(num_digits + 1, out=token_bytes[1:])
+    empty_before = np.cumsum(empty) - empty
+    row_starts = token_bytes[indptr[:-1]] + empty_before
+    
+    buf = np.empty(int(token_bytes[-1] + np.count_nonzero(empty)), dtype=np.uint8)
+    buf[row_starts[empty]] = _NEWLINE
+    
+    starts = token_bytes[:-1] + np.repeat(empty_before, row_lengths)
+    ends = starts + num_digits
+    buf[ends] = _SPACE
+    buf[ends[indptr[1:][~empty] - 1]] = _NEWLINE
+    
+    # Digits from least significant: digit k of every item long enough
+    remaining = items.copy()
+    positions = ends - 1
+    for _ in range(int(num_digits.max(initial=0))):
+        buf[positions] = _ZERO + remaining % 10
+        remaining //= 10
+        long_enough = remaining > 0
+        if not long_enough.all():
+            remaining = remaining[long_enough]
+            positions = positions[long_enough]
+        positions = positions - 1
+    
+    return buf.tobytes()
@@ -4,10 +4,213 @@ File I/O Module
 Utilities for reading and writing various file formats.
 """
 
+import copy
+import fnmatch
+import functools
+import gzip
+import hashlib
+import io
+import itertools
 import json
+import mmap
+import os
+import threading
 import yaml
+import numpy as np
+from scipy import sparse
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Union
+
+try:
+    from ._spmf_parse import format_spmf, parse_spmf
+except ImportError:
+    # Run as a script (python src/utils/file_io.py): no parent package
+    from _spmf_parse import format_spmf, parse_spmf
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# libyaml-backed (C) loader and dumper when available
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Files larger than this are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1 << 20
+
+# Transactions joined per write by write_spmf
+SPMF_BLOCK_ROWS = 1 << 16
+
+# Largest item ID range write_spmf formats through a lookup table
+ITOA_TABLE_LIMIT = 1_000_000
+
+# Buffer size of files read or written sequentially (SPMF scans)
+IO_BUFFER_SIZE = 1 << 20
+
+# Compression levels for .gz and .zst SPMF files (favour speed over ratio)
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 1
+
+# Per-thread zstd compressor, reused across writes
+_zstd_local = threading.local()
+
+
+@contextmanager
+def _mapped(filepath: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Give access to the raw contents of a file.
+    
+    Large files are memory-mapped (read-only), so their pages come straight
+    from the page cache without a copy into a Python buffer; small files
+    are cheaper to read in one call.
+    
+    Yields:
+        File contents as bytes, or as an mmap for files above MMAP_THRESHOLD
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            yield f.read()
+            return
+        
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+@functools.lru_cache(maxsize=1024)
+def _ensured(dirpath: str):
+    """
+    Create a directory (and its parents) once per process.
+    
+    Writers call this before every write, so only the first write into a
+    directory pays for the mkdir; call _ensured.cache_clear() if
+    directories may be removed while the process runs.
+    """
+    Path(dirpath).mkdir(parents=True, exist_ok=True)
+
+
+def _is_compressed(filepath: str) -> bool:
+    """Tell whether _open decompresses a file, based on its suffix."""
+    return filepath.lower().endswith((".gz", ".zst"))
+
+
+def _zstd_compressor():
+    """Multi-threaded zstd compressor of the calling thread."""
+    cctx = getattr(_zstd_local, "cctx", None)
+    if cctx is None:
+        cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    return cctx
+
+
+def _open(filepath: str, mode: str = "rb"):
+    """
+    Open a file in binary mode, decompressing by suffix.
+    
+    Files ending in .gz go through gzip and files ending in .zst through
+    zstandard (optional dependency); any other file is opened as is.
+    Reads and writes go through IO_BUFFER_SIZE buffers, so line-by-line
+    scans make few read() system calls.
+    
+    Args:
+        filepath: Path to file
+        mode: "rb" or "wb"
+    
+    Returns:
+        Binary file object supporting read/readline/iteration or write
+    """
+    suffix = os.path.splitext(filepath)[1].lower()
+    
+    if suffix == ".gz":
+        return gzip.open(filepath, mode, compresslevel=GZIP_LEVEL)
+    
+    if suffix == ".zst":
+        if zstandard is None:
+            raise ImportError(
+                "zstandard is required for .zst files. "
+                "Install it with: pip install zstandard"
+            )
+        raw = open(filepath, mode, buffering=IO_BUFFER_SIZE)
+        if "w" in mode:
+            return _zstd_compressor().stream_writer(raw, closefd=True)
+        # The decompression reader has no readline; buffer it for iteration
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.BufferedReader(reader, buffer_size=IO_BUFFER_SIZE)
+    
+    return open(filepath, mode, buffering=IO_BUFFER_SIZE)
+
+
+def _spmf_blocks(transactions: Iterable[Sequence[int]]) -> Iterator[bytes]:
+    """Encode transactions as SPMF lines, SPMF_BLOCK_ROWS per chunk."""
+    # Item IDs are small non-negative ints: format each distinct value once
+    # and look the others up instead of calling str() per item. The table
+    # grows block by block, so transactions is only iterated once
+    labels = []
+    transactions = iter(transactions)
+    while True:
+        block = list(itertools.islice(transactions, SPMF_BLOCK_ROWS))
+        if not block:
+            return
+        
+        nonempty = list(filter(len, block))
+        if min(map(min, nonempty), default=0) < 0:
+            raise ValueError("SPMF item IDs must be non-negative")
+        highest = max(map(max, nonempty), default=0)
+        if highest < ITOA_TABLE_LIMIT:
+            labels.extend(str(i) for i in range(len(labels), highest + 1))
+            to_str = labels.__getitem__
+        else:
+            to_str = str
+        
+        payload = "\n".join([" ".join(map(to_str, t)) for t in block]) + "\n"
+        yield payload.encode("ascii")
+
+
+def _csr_blocks(items: np.ndarray, indptr: np.ndarray) -> Iterator[bytes]:
+    """Encode CSR transactions as SPMF lines, SPMF_BLOCK_ROWS per chunk."""
+    indptr = np.asarray(indptr, dtype=np.int64)
+    num_rows = indptr.size - 1
+    for start in range(0, num_rows, SPMF_BLOCK_ROWS):
+        bounds = indptr[start:start + SPMF_BLOCK_ROWS + 1]
+        yield format_spmf(items[bounds[0]:bounds[-1]], bounds - bounds[0])
+
+
+def _write_blocks(filepath: str, blocks: Iterator[bytes]):
+    """Write encoded SPMF blocks to a file, compressing by suffix."""
+    if _is_compressed(filepath):
+        with _open(filepath, "wb") as f:
+            for payload in blocks:
+                f.write(payload)
+        return
+    
+    # One raw os.write per block: the payload is plain ASCII, so no text
+    # or buffered IO layer is needed
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        for payload in blocks:
+            _write_all(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes):
+    """Write all of data to a raw file descriptor (os.write may be partial)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
 class FileIO:
@@ -20,12 +223,24 @@ class FileIO:
         """
         Read JSON file.
         
+        Files orjson rejects (e.g. with the NaN or Infinity literals that
+        json accepts) are parsed again with json, which also reports any
+        real syntax error.
+        
         Args:
             filepath: Path to JSON file
         
         Returns:
             Parsed JSON as dictionary
         """
+        if orjson is not None:
+            # orjson parses any buffer, including a mapped file
+            try:
+                with _mapped(filepath) as data, memoryview(data) as view:
+                    return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass
+        
         with open(filepath, "r", encoding="utf-8") as f:
             return json.load(f)
     
@@ -38,8 +253,28 @@ class FileIO:
             data: Dictionary to save
             filepath: Output file path
             indent: JSON indentation level
+        
+        Note:
+            With orjson, NaN and infinite floats are written as null (json
+            writes the non-standard NaN/Infinity literals).
         """
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        _ensured(os.path.dirname(os.path.abspath(filepath)))
+        
+        # orjson only indents by 2; other levels go through json, as does
+        # data orjson cannot serialize (e.g. float subclasses)
+        if orjson is not None and indent in (None, 0, 2):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                encoded = orjson.dumps(data, option=option)
+            except TypeError:
+                encoded = None
+            if encoded is not None:
+                with open(filepath, "wb") as f:
+                    f.write(encoded)
+                return
+        
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=indent, ensure_ascii=False)
     
@@ -55,60 +290,176 @@ class FileIO:
             Parsed YAML as dictionary
         """
         with open(filepath, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
     
     @staticmethod
     def write_yaml(data: Dict, filepath: str):
         """
         Write data to YAML file.
         
+        Keys are written in dictionary (insertion) order, and long strings
+        are kept on one line.
+        
         Args:
             data: Dictionary to save
             filepath: Output file path
         """
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        _ensured(os.path.dirname(os.path.abspath(filepath)))
         with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                data,
+                f,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                width=1 << 16
+            )
     
     @staticmethod
     def read_spmf(filepath: str) -> List[List[int]]:
         """
         Read SPMF format file.
         
+        Files ending in .gz or .zst are decompressed on the fly. Item IDs
+        must be non-negative integers written as plain digits (no sign) and
+        separated by spaces or tabs; anything else (e.g. "-1" separators,
+        "+5" or "#SUP:" annotations) raises ValueError. write_spmf only
+        writes files in this format.
+        
         Args:
             filepath: Path to SPMF file
         
         Returns:
             List of transactions (each transaction is a list of item IDs)
         """
-        transactions = []
+        items, offsets = FileIO._parse_spmf_file(filepath)
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        items = items.tolist()
+        bounds = offsets.tolist()
+        return [items[bounds[r]:bounds[r + 1]] for r in range(len(bounds) - 1)]
+    
+    @staticmethod
+    def read_spmf_arrays(filepath: str) -> List[np.ndarray]:
+        """
+        Read SPMF format file into NumPy arrays.
+        
+        The whole file is tokenized in array passes; each transaction is a
+        view into one buffer of item IDs.
+        
+        Args:
+            filepath: Path to SPMF file
+        
+        Returns:
+            List of transactions (each an int64 array of item IDs)
+        """
+        items, offsets = FileIO._parse_spmf_file(filepath)
+        return np.split(items, offsets[1:-1]) if offsets.size > 1 else []
+    
+    @staticmethod
+    def iter_spmf(filepath: str) -> Iterator[List[int]]:
+        """
+        Iterate over the transactions of an SPMF file one line at a time.
+        
+        Unlike read_spmf, only the current transaction is held in memory.
+        
+        Args:
+            filepath: Path to SPMF file
+        
+        Yields:
+            Transactions (lists of item IDs)
+        
+        Raises:
+            ValueError: On a token that is not a non-negative integer, as
+                read_spmf does
+        """
+        with _open(filepath, "rb") as f:
+            for line_num, line in enumerate(f, 1):
+                tokens = line.split()
+                if not tokens:
                     continue
-                
-                # Parse space-separated integers
-                items = [int(x) for x in line.split() if x.strip()]
-                transactions.append(items)
+                if not all(map(bytes.isdigit, tokens)):
+                    raise ValueError(f"Invalid item on line {line_num} of SPMF data: {line!r}")
+                yield list(map(int, tokens))
+    
+    @staticmethod
+    def read_spmf_csr(filepath: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read SPMF format file as CSR arrays.
         
-        return transactions
+        The items of transaction r are indices[indptr[r]:indptr[r + 1]];
+        sparse.csr_matrix((np.ones(len(indices)), indices, indptr)) gives
+        the binary matrix used by DataGenerator and PatternInjector.
+        
+        Args:
+            filepath: Path to SPMF file
+        
+        Returns:
+            Tuple (indices, indptr) of int64 arrays
+        """
+        return FileIO._parse_spmf_file(filepath)
     
     @staticmethod
-    def write_spmf(transactions: List[List[int]], filepath: str):
+    def _parse_spmf_file(filepath: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Tokenize an SPMF file into (items, offsets), see parse_spmf."""
+        if _is_compressed(filepath):
+            with _open(filepath, "rb") as f:
+                return parse_spmf(np.frombuffer(f.read(), dtype=np.uint8))
+        
+        error = None
+        with _mapped(filepath) as data:
+            buf = np.frombuffer(data, dtype=np.uint8)
+            try:
+                return parse_spmf(buf)
+            except ValueError as e:
+                # The traceback's frames hold views of buf: keep only the
+                # message, so the mapped file can be closed before raising
+                error = str(e)
+            finally:
+                # Release the export so a mapped file can be closed
+                del buf
+        raise ValueError(error)
+    
+    @staticmethod
+    def write_spmf(transactions: Iterable[Sequence[int]], filepath: str):
         """
         Write transactions to SPMF format file.
         
+        Files ending in .gz or .zst are compressed (gzip level GZIP_LEVEL,
+        multi-threaded zstd level ZSTD_LEVEL).
+        
         Args:
-            transactions: List of transactions
+            transactions: Iterable of transactions (e.g. a list, or
+                          iter_spmf of another file); only SPMF_BLOCK_ROWS
+                          of them are held in memory at a time
             filepath: Output file path
+        
+        Raises:
+            ValueError: On a negative item ID; the readers only accept
+                non-negative integers, so such a file would not read back
+        """
+        _ensured(os.path.dirname(os.path.abspath(filepath)))
+        _write_blocks(filepath, _spmf_blocks(transactions))
+    
+    @staticmethod
+    def write_spmf_from_csr(items: np.ndarray, indptr: np.ndarray, filepath: str):
         """
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        Write CSR transactions to SPMF format file.
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            for transaction in transactions:
-                f.write(" ".join(map(str, transaction)) + "\n")
+        The inverse of read_spmf_csr: transaction r is
+        items[indptr[r]:indptr[r + 1]] (e.g. the indices and indptr of a CSR
+        matrix). Blocks of SPMF_BLOCK_ROWS rows are formatted by array
+        operations (see format_spmf), with no Python call per item.
+        Files ending in .gz or .zst are compressed, as in write_spmf.
+        
+        Args:
+            items: Non-negative integer item IDs of all transactions
+            indptr: Row offsets into items (length num_transactions + 1)
+            filepath: Output file path
+        """
+        _ensured(os.path.dirname(os.path.abspath(filepath)))
+        
+        _write_blocks(filepath, _csr_blocks(items, indptr))
     
     @staticmethod
     def read_text(filepath: str) -> str:
@@ -121,7 +472,26 @@ class FileIO:
         Returns:
             File contents as string
         """
-        with open(filepath, "r", encoding="utf-8") as f:
+        with _mapped(filepath) as data:
+            text = str(data, "utf-8")
+        
+        # Same newline translation as text mode
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+    
+    @staticmethod
+    def read_bytes(filepath: str) -> bytes:
+        """
+        Read a file without decoding it.
+        
+        Args:
+            filepath: Path to file
+        
+        Returns:
+            Raw file contents
+        """
+        with open(filepath, "rb") as f:
             return f.read()
     
     @staticmethod
@@ -133,7 +503,7 @@ class FileIO:
             content: Text content
             filepath: Output file path
         """
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        _ensured(os.path.dirname(os.path.abspath(filepath)))
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(content)
     
@@ -145,7 +515,7 @@ class FileIO:
         Args:
             dirpath: Directory path
         """
-        Path(dirpath).mkdir(parents=True, exist_ok=True)
+        _ensured(os.path.abspath(dirpath))
     
     @staticmethod
     def list_files(dirpath: str, pattern: str = "*") -> List[str]:
@@ -157,15 +527,77 @@ class FileIO:
             pattern: Glob pattern (e.g., "*.json", "*.spmf")
         
         Returns:
-            List of file paths
+            List of file paths (empty if dirpath is not a directory)
+        """
+        if not os.path.isdir(dirpath):
+            return []
+        
+        # Recursive or multi-level patterns need pathlib's glob
+        if "**" in pattern or "/" in pattern or os.sep in pattern:
+            return [str(p) for p in Path(dirpath).glob(pattern)]
+        
+        # One readdir pass; entries are matched by name without building
+        # Path objects or stat-ing them
+        with os.scandir(dirpath) as entries:
+            return [entry.path for entry in entries if fnmatch.fnmatchcase(entry.name, pattern)]
+    
+    @staticmethod
+    def cached_dataset(
+        config: Dict,
+        generator_fn: Callable[[], Union[sparse.spmatrix, np.ndarray]],
+        cache_dir: str
+    ) -> Union[sparse.spmatrix, np.ndarray]:
+        """
+        Generate a dataset once per configuration, then load it from disk.
+        
+        The cache key is a hash of config, so config must hold everything
+        the result depends on (e.g. add the seed, and a version or hash of
+        the generating code, to it). Sparse matrices
+        are stored as .npz, dense arrays as .npy; files are written to a
+        temporary name and renamed, so a concurrent reader never sees a
+        partial file.
+        
+        Args:
+            config: JSON-serializable dictionary identifying the dataset
+            generator_fn: Function generating the dataset on a cache miss
+            cache_dir: Directory holding the cached datasets
+        
+        Returns:
+            The dataset returned by generator_fn (or its cached copy)
         """
-        return [str(p) for p in Path(dirpath).glob(pattern)]
+        encoded = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+        key = hashlib.blake2b(encoded.encode("utf-8"), digest_size=8).hexdigest()
+        sparse_path = os.path.join(cache_dir, key + ".npz")
+        dense_path = os.path.join(cache_dir, key + ".npy")
+        
+        if os.path.exists(sparse_path):
+            return sparse.load_npz(sparse_path)
+        if os.path.exists(dense_path):
+            return np.load(dense_path)
+        
+        data = generator_fn()
+        
+        _ensured(os.path.abspath(cache_dir))
+        path = sparse_path if sparse.issparse(data) else dense_path
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            if sparse.issparse(data):
+                sparse.save_npz(f, data)
+            else:
+                np.save(f, data)
+        os.replace(tmp_path, path)
+        
+        return data
 
 
 def load_config(config_path: Optional[str] = None) -> Dict:
     """
     Load global configuration from YAML file.
     
+    Parsed files are cached per (resolved path, mtime), so repeated loads
+    skip the YAML parse until the file changes. Each call returns its own
+    copy, which callers may modify freely.
+    
     Args:
         config_path: Path to config file (default: config/settings.yaml)
     
@@ -176,7 +608,18 @@ def load_config(config_path: Optional[str] = None) -> Dict:
         # Default to config/settings.yaml
         config_path = Path(__file__).parent.parent.parent / "config" / "settings.yaml"
     
-    return FileIO.read_yaml(str(config_path))
+    path = Path(config_path).resolve()
+    return copy.deepcopy(_load_config_cached(str(path), os.stat(path).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict:
+    """Parse a config file; mtime_ns is only part of the cache key."""
+    return FileIO.read_yaml(config_path)
+
+
+# Lets tests (or long-running callers) drop every cached config
+load_config.cache_clear = _load_config_cached.cache_clear
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+"""
+Shared Test Fixtures
+"""
+
+import hashlib
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from generator.core import DataGenerator
+from llm.parser import ConfigParser
+from utils.file_io import FileIO
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Parser with default settings (strict: raises on any invalid field)."""
+    return ConfigParser()
+
+
+@pytest.fixture(scope="session")
+def lenient_parser():
+    """Parser filling defaults and skipping invalid patterns."""
+    return ConfigParser(strict_mode=False)
+
+
+@pytest.fixture(scope="session")
+def generate(pytestconfig):
+    """
+    Run generator.generate(seed), cached on disk when LLMDM_TEST_CACHE=1.
+    
+    Cached datasets live in the pytest cache directory (pytest
+    --cache-clear drops them), which all pytest-xdist workers share, so a
+    dataset generated by one worker is loaded by the others; on a hit,
+    generator.data is set to the loaded matrix so the generator's other
+    methods still work. The cache key includes a hash of the generator
+    sources, so editing the generator invalidates every cached dataset.
+    """
+    if os.environ.get("LLMDM_TEST_CACHE") != "1":
+        return lambda generator, seed: generator.generate(seed=seed)
+    
+    cache_dir = str(pytestconfig.cache.mkdir("llmdm-datasets"))
+    
+    code_hash = hashlib.blake2b(digest_size=8)
+    for source in sorted((SRC_DIR / "generator").glob("*.py")):
+        code_hash.update(source.name.encode("utf-8"))
+        code_hash.update(source.read_bytes())
+    code = code_hash.hexdigest()
+    
+    def generate_cached(generator, seed):
+        key = {"config": generator.config, "seed": seed, "code": code}
+        generator.data = FileIO.cached_dataset(
+            key,
+            lambda: generator.generate(seed=seed),
+            cache_dir
+        )
+        return generator.data
+    
+    return generate_cached
+
+
+@pytest.fixture(scope="session")
+def basic_dataset(generate):
+    """Uniform 100 x 50 dataset without patterns, generated once.
+    
+    Returns:
+        (generator, data) tuple; tests must not modify either
+    """
+    config = {
+        "dataset_meta": {
+            "num_transactions": 100,
+            "num_items": 50,
+            "density": 0.1,
+            "avg_transaction_len": 5
+        },
+        "distribution_config": {
+            "method": "random",
+            "params": {}
+        },
+        "pattern_injection": []
+    }
+    
+    generator = DataGenerator(config)
+    return generator, generate(generator, 42)
+
+
+@pytest.fixture(scope="session")
+def pattern_dataset(generate):
+    """Zipf 500 x 100 dataset with one injected pattern, generated once.
+    
+    Returns:
+        (generator, data) tuple; tests must not modify either
+    """
+    config = {
+        "dataset_meta": {
+            "num_transactions": 500,
+            "num_items": 100,
+            "density": 0.08,
+            "avg_transaction_len": 8
+        },
+        "distribution_config": {
+            "method": "zipf",
+            "params": {"alpha": 1.1}
+        },
+        "pattern_injection": [
+            {
+                "id": "test_pattern",
+                "items": [10, 20, 30],
+                "target_support": 0.1,
+                "noise_ratio": 0.05
+            }
+        ]
+    }
+    
+    generator = DataGenerator(config)
+    return generator, generate(generator, 42)
@@ -0,0 +1,259 @@
+"""
+Unit Tests for File I/O Module
+"""
+
+import pytest
+import numpy as np
+from scipy import sparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import _spmf_parse, file_io
+from utils.file_io import FileIO, load_config
+
+
+class TestFileIO:
+    """Tests for file reading and writing."""
+    
+    def test_json_roundtrip(self, tmp_path):
+        """Test writing and reading back a JSON file."""
+        data = {"name": "données", "values": [1, 2.5, None], "nested": {"a": True}}
+        
+        for indent in (2, 4, None):
+            filepath = tmp_path / f"test_{indent}.json"
+            FileIO.write_json(data, str(filepath), indent=indent)
+            
+            assert FileIO.read_json(str(filepath)) == data
+            assert "données" in filepath.read_text(encoding="utf-8")
+    
+    def test_json_compat(self, tmp_path):
+        """Test JSON values that json accepts but orjson does not by default."""
+        filepath = tmp_path / "compat.json"
+        
+        FileIO.write_json({"a": np.float64(0.5), "b": np.int64(3), "c": [np.float32(1.5)]}, str(filepath))
+        assert FileIO.read_json(str(filepath)) == {"a": 0.5, "b": 3, "c": [1.5]}
+        
+        filepath.write_text('{"low": -Infinity, "bad": NaN}')
+        data = FileIO.read_json(str(filepath))
+        assert data["low"] == float("-inf")
+        assert data["bad"] != data["bad"]
+        
+        filepath.write_text('{"a": ')
+        with pytest.raises(ValueError):
+            FileIO.read_json(str(filepath))
+    
+    def test_spmf_roundtrip(self, tmp_path):
+        """Test writing and reading back an SPMF file."""
+        transactions = [[1, 2, 3], [2, 40], [7], [1, 3, 5, 1000]]
+        filepath = tmp_path / "test.spmf"
+        
+        FileIO.write_spmf(transactions, str(filepath))
+        
+        assert FileIO.read_spmf(str(filepath)) == transactions
+        arrays = FileIO.read_spmf_arrays(str(filepath))
+        assert [a.tolist() for a in arrays] == transactions
+        assert list(FileIO.iter_spmf(str(filepath))) == transactions
+        
+        indices, indptr = FileIO.read_spmf_csr(str(filepath))
+        assert indptr.tolist() == [0, 3, 5, 6, 10]
+        assert indices.tolist() == [item for t in transactions for item in t]
+        
+        FileIO.write_spmf([[5, 2_000_000], [], [1]], str(filepath))
+        assert FileIO.read_spmf(str(filepath)) == [[5, 2_000_000], [1]]
+        
+        # Any iterable, e.g. streaming one file into another
+        copy = tmp_path / "copy.spmf"
+        FileIO.write_spmf(FileIO.iter_spmf(str(filepath)), str(copy))
+        assert copy.read_bytes() == filepath.read_bytes().replace(b"\n\n", b"\n")
+        
+        filepath.write_bytes(b"")
+        assert FileIO.read_spmf(str(filepath)) == []
+        assert FileIO.read_spmf_arrays(str(filepath)) == []
+    
+    def test_spmf_invalid(self, tmp_path):
+        """Test that malformed SPMF lines are rejected by every reader."""
+        filepath = tmp_path / "bad.spmf"
+        
+        for content in (b"1 -2 3\n", b"+4\n", b"1 2\n4 5 #SUP: 7\n", b"1.5\n", b"1 abc\n"):
+            filepath.write_bytes(content)
+            
+            with pytest.raises(ValueError):
+                FileIO.read_spmf(str(filepath))
+            with pytest.raises(ValueError):
+                FileIO.read_spmf_csr(str(filepath))
+            with pytest.raises(ValueError):
+                list(FileIO.iter_spmf(str(filepath)))
+        
+        filepath.write_bytes(b"1\t2\r\n\n3  4")
+        assert FileIO.read_spmf(str(filepath)) == [[1, 2], [3, 4]]
+        assert list(FileIO.iter_spmf(str(filepath))) == [[1, 2], [3, 4]]
+    
+    def test_spmf_invalid_mapped(self, tmp_path, monkeypatch):
+        """Test that malformed memory-mapped files raise ValueError too."""
+        monkeypatch.setattr(file_io, "MMAP_THRESHOLD", 16)
+        filepath = tmp_path / "bad.spmf"
+        
+        for content in (b"1 2 3\n4 -1 5\n6 7 8\n", b"1 2 3\n" + b"9" * 25 + b"\n"):
+            filepath.write_bytes(content)
+            
+            with pytest.raises(ValueError):
+                FileIO.read_spmf(str(filepath))
+            with pytest.raises(ValueError):
+                FileIO.read_spmf_csr(str(filepath))
+        
+        filepath.write_bytes(b"1 2 3\n4 10 5\n6 7 8\n")
+        assert FileIO.read_spmf(str(filepath)) == [[1, 2, 3], [4, 10, 5], [6, 7, 8]]
+    
+    def test_spmf_chunked(self, tmp_path, monkeypatch):
+        """Test that parsing in small chunks gives the same transactions."""
+        transactions = [[i, 10 * i, 1000 + i] for i in range(50)] + [[123456789]]
+        filepath = tmp_path / "test.spmf"
+        FileIO.write_spmf(transactions, str(filepath))
+        
+        for chunk_bytes in (1, 7, 64):
+            monkeypatch.setattr(_spmf_parse, "CHUNK_BYTES", chunk_bytes)
+            assert FileIO.read_spmf(str(filepath)) == transactions
+    
+    def test_spmf_blocks(self, tmp_path, monkeypatch):
+        """Test writing transactions in several blocks."""
+        monkeypatch.setattr(file_io, "SPMF_BLOCK_ROWS", 2)
+        transactions = [[1, 2], [30], [], [7, 400], [5], [2_000_000]]
+        filepath = tmp_path / "blocks.spmf"
+        
+        FileIO.write_spmf(iter(transactions), str(filepath))
+        
+        assert filepath.read_text().splitlines() == ["1 2", "30", "", "7 400", "5", "2000000"]
+    
+    def test_spmf_from_csr(self, tmp_path, monkeypatch):
+        """Test writing CSR arrays to SPMF."""
+        monkeypatch.setattr(file_io, "SPMF_BLOCK_ROWS", 3)
+        transactions = [[0, 9, 10], [], [99, 100, 12345678901], [7], [], [5, 6]]
+        items = np.array([item for t in transactions for item in t])
+        indptr = np.cumsum([0] + [len(t) for t in transactions])
+        
+        for name in ("csr.spmf", "csr.spmf.gz"):
+            filepath = tmp_path / name
+            FileIO.write_spmf_from_csr(items, indptr, str(filepath))
+            
+            assert list(FileIO.iter_spmf(str(filepath))) == [t for t in transactions if t]
+        
+        FileIO.write_spmf(transactions, str(tmp_path / "lists.spmf"))
+        assert (tmp_path / "csr.spmf").read_bytes() == (tmp_path / "lists.spmf").read_bytes()
+        
+        with pytest.raises(ValueError):
+            FileIO.write_spmf([[1], [3, -1]], str(tmp_path / "lists.spmf"))
+        
+        with pytest.raises(ValueError):
+            FileIO.write_spmf_from_csr(np.array([1, -2]), np.array([0, 2]), str(filepath))
+    
+    def test_compressed_spmf(self, tmp_path):
+        """Test gzip-compressed SPMF files."""
+        transactions = [[i, i + 3, 2 * i + 10] for i in range(500)]
+        filepath = tmp_path / "test.spmf.gz"
+        
+        FileIO.write_spmf(transactions, str(filepath))
+        
+        assert filepath.read_bytes()[:2] == b"\x1f\x8b"
+        assert FileIO.read_spmf(str(filepath)) == transactions
+        assert list(FileIO.iter_spmf(str(filepath))) == transactions
+    
+    @pytest.mark.skipif(file_io.zstandard is None, reason="zstandard not installed")
+    def test_zstd_spmf(self, tmp_path):
+        """Test zstd-compressed SPMF files."""
+        transactions = [[i, i + 3, 2 * i + 10] for i in range(500)]
+        filepath = tmp_path / "test.spmf.zst"
+        
+        FileIO.write_spmf(transactions, str(filepath))
+        
+        assert FileIO.read_spmf(str(filepath)) == transactions
+        assert list(FileIO.iter_spmf(str(filepath))) == transactions
+    
+    def test_cached_dataset(self, tmp_path):
+        """Test that cached datasets are generated once and reloaded."""
+        calls = []
+        
+        def generate():
+            calls.append(1)
+            return sparse.random(20, 10, density=0.3, format="csr", dtype=np.int8, random_state=0)
+        
+        first = FileIO.cached_dataset({"seed": 1}, generate, str(tmp_path))
+        second = FileIO.cached_dataset({"seed": 1}, generate, str(tmp_path))
+        FileIO.cached_dataset({"seed": 2}, generate, str(tmp_path))
+        
+        assert len(calls) == 2
+        assert second.dtype == np.int8
+        assert (first != second).nnz == 0
+        
+        dense = FileIO.cached_dataset({"dense": True}, lambda: np.eye(3), str(tmp_path))
+        assert (FileIO.cached_dataset({"dense": True}, None, str(tmp_path)) == dense).all()
+        assert not list(tmp_path.glob("*.tmp"))
+    
+    def test_large_files(self, tmp_path, monkeypatch):
+        """Test that memory-mapped reads match regular reads."""
+        monkeypatch.setattr(file_io, "MMAP_THRESHOLD", 16)
+        
+        transactions = [[i, i + 1, i + 2] for i in range(100)]
+        FileIO.write_spmf(transactions, str(tmp_path / "test.spmf"))
+        assert FileIO.read_spmf(str(tmp_path / "test.spmf")) == transactions
+        
+        data = {"values": list(range(100))}
+        FileIO.write_json(data, str(tmp_path / "test.json"))
+        assert FileIO.read_json(str(tmp_path / "test.json")) == data
+        
+        (tmp_path / "test.txt").write_bytes("ligne é\r\nsuite\n".encode("utf-8") * 10)
+        assert FileIO.read_text(str(tmp_path / "test.txt")) == "ligne é\nsuite\n" * 10
+    
+    def test_list_files(self, tmp_path):
+        """Test listing files by pattern."""
+        for name in ("a.spmf", "b.spmf", "c.json", "sub/d.spmf"):
+            FileIO.write_text("", str(tmp_path / name))
+        
+        found = FileIO.list_files(str(tmp_path), "*.spmf")
+        assert sorted(Path(p).name for p in found) == ["a.spmf", "b.spmf"]
+        
+        found = FileIO.list_files(str(tmp_path), "**/*.spmf")
+        assert sorted(Path(p).name for p in found) == ["a.spmf", "b.spmf", "d.spmf"]
+        
+        assert FileIO.list_files(str(tmp_path / "missing"), "*.spmf") == []
+    
+    def test_yaml_roundtrip(self, tmp_path):
+        """Test writing and reading back a YAML file."""
+        data = {"name": "données", "values": [1, 2, 3], "nested": {"a": 0.5}}
+        filepath = tmp_path / "test.yaml"
+        
+        FileIO.write_yaml(data, str(filepath))
+        
+        assert FileIO.read_yaml(str(filepath)) == data
+        
+        # Key order is kept and long values are not wrapped
+        text = filepath.read_text(encoding="utf-8")
+        assert text.index("name:") < text.index("values:") < text.index("nested:")
+        
+        FileIO.write_yaml({"prompt": "mot " * 100}, str(filepath))
+        assert len(filepath.read_text(encoding="utf-8").splitlines()) == 1
+    
+    def test_load_default_config(self):
+        """Test loading the project settings."""
+        config = load_config()
+        
+        assert isinstance(config, dict)
+    
+    def test_config_cache(self, tmp_path):
+        """Test that cached configs are copied and refreshed on change."""
+        filepath = tmp_path / "settings.yaml"
+        FileIO.write_yaml({"llm": {"model": "a"}}, str(filepath))
+        
+        config = load_config(str(filepath))
+        config["llm"]["model"] = "changed"
+        assert load_config(str(filepath)) == {"llm": {"model": "a"}}
+        
+        FileIO.write_yaml({"llm": {"model": "b"}}, str(filepath))
+        load_config.cache_clear()
+        assert load_config(str(filepath)) == {"llm": {"model": "b"}}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
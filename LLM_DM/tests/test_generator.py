@@ -4,6 +4,7 @@ Unit Tests for Data Generator Module
 
 import pytest
 import numpy as np
+from scipy import sparse
 import sys
 from pathlib import Path
 
@@ -37,6 +38,43 @@ class TestDistributionEngine:
         # First item should be most frequent
         assert probs[0] == max(probs)
     
+    def test_normal_distribution(self):
+        """Test Normal distribution."""
+        probs = DistributionEngine.generate_item_frequencies(
+            101, "normal", {"mean": 0.5, "std": 0.15}
+        )
+        
+        assert np.isclose(probs.sum(), 1.0)
+        # Peak at the mean, symmetric around it
+        assert probs.argmax() == 50
+        assert np.allclose(probs, probs[::-1])
+    
+    def test_sample_zipf(self):
+        """Test that the Zipf sampler matches the Zipf item frequencies."""
+        rng = np.random.default_rng(0)
+        
+        for alpha in (0.8, 1.0, 1.5):
+            samples = DistributionEngine.sample_zipf(20, alpha, 200000, rng)
+            probs = DistributionEngine.generate_item_frequencies(
+                20, "zipf", {"alpha": alpha}
+            )
+            
+            assert samples.min() >= 0 and samples.max() < 20
+            freqs = np.bincount(samples, minlength=20) / samples.size
+            assert np.allclose(freqs, probs, atol=0.005)
+    
+    def test_compiled_distribution(self):
+        """Test that a compiled distribution returns the same probabilities."""
+        params = {"mean": 0.3, "std": 0.1}
+        item_frequencies = DistributionEngine.compile(50, "normal", params)
+        
+        probs = item_frequencies()
+        assert np.array_equal(
+            probs, DistributionEngine.generate_item_frequencies(50, "normal", params)
+        )
+        assert item_frequencies() is probs
+        assert not probs.flags.writeable
+    
     def test_invalid_distribution(self):
         """Test that invalid distribution raises error."""
         with pytest.raises(ValueError):
@@ -80,58 +118,212 @@ class TestPatternInjector:
         # With noise, actual support should be lower
         actual_support = PatternInjector.verify_pattern(data, pattern)
         assert actual_support < target_support
+    
+    def test_inject_high_support(self):
+        """Test injecting patterns present in most transactions."""
+        num_trans = 1000
+        num_items = 50
+        
+        data = np.zeros((num_trans, num_items), dtype=np.int8)
+        injector = PatternInjector(num_trans, num_items, rng=0)
+        
+        data = injector.inject_multiple_patterns(data, [
+            {"items": [1, 2], "target_support": 0.8},
+            {"items": [3, 4], "target_support": 0.9}
+        ])
+        
+        assert PatternInjector.verify_pattern(data, [1, 2]) == 0.8
+        assert PatternInjector.verify_pattern(data, [3, 4]) == 0.9
+    
+    def test_inject_sparse_matrix(self):
+        """Test injection and verification on a CSR matrix."""
+        num_trans = 1000
+        num_items = 50
+        
+        data = sparse.csr_matrix((num_trans, num_items), dtype=np.int8)
+        injector = PatternInjector(num_trans, num_items)
+        
+        pattern = [5, 10, 15]
+        data = injector.inject_pattern(data, pattern, 0.1)
+        data = injector.inject_pattern(data, [10, 15], 0.2)
+        
+        assert sparse.issparse(data)
+        assert data.max() == 1
+        assert PatternInjector.verify_pattern(data, pattern) == \
+            PatternInjector.verify_pattern(data.toarray(), pattern)
+        assert 0.08 <= PatternInjector.verify_pattern(data, pattern) <= 0.12
+    
+    def test_verify_patterns_batch(self):
+        """Test batch verification against single-pattern verification."""
+        num_trans = 500
+        num_items = 30
+        
+        rng = np.random.default_rng(0)
+        data = (rng.random((num_trans, num_items)) < 0.3).astype(np.int8)
+        patterns = [[1, 2], [3, 4, 5], [7], []]
+        
+        supports = PatternInjector.verify_patterns(sparse.csr_matrix(data), patterns)
+        
+        for pattern, support in zip(patterns, supports):
+            assert support == PatternInjector.verify_pattern(data, pattern)
+    
+    def test_packed_injection(self):
+        """Test injection and verification on a bit-packed matrix."""
+        num_trans = 1000
+        num_items = 50
+        
+        rng = np.random.default_rng(1)
+        data = (rng.random((num_trans, num_items)) < 0.1).astype(np.int8)
+        packed = PatternInjector.to_packed(data)
+        assert (PatternInjector.from_packed(packed, num_items) == data).all()
+        
+        injector = PatternInjector(num_trans, num_items)
+        injector.rng = np.random.default_rng(2)
+        pattern = [5, 10, 15, 40]
+        packed = injector.inject_pattern_packed(packed, pattern, 0.1)
+        
+        injector.rng = np.random.default_rng(2)
+        data = injector.inject_pattern(data, pattern, 0.1)
+        
+        assert (PatternInjector.from_packed(packed, num_items) == data).all()
+        assert PatternInjector.verify_pattern_packed(packed, pattern) == \
+            PatternInjector.verify_pattern(data, pattern)
+    
+    def test_tidset_verification(self):
+        """Test pattern supports computed from item tidsets."""
+        num_trans = 1000
+        num_items = 30
+        
+        rng = np.random.default_rng(3)
+        data = (rng.random((num_trans, num_items)) < 0.4).astype(np.int8)
+        tidsets = PatternInjector.to_tidsets(sparse.csr_matrix(data))
+        
+        assert tidsets.shape == (num_items, 16)
+        assert (tidsets == PatternInjector.to_tidsets(data)).all()
+        for pattern in ([0], [1, 2], [3, 4, 29], []):
+            assert PatternInjector.verify_pattern_tidsets(tidsets, pattern, num_trans) == \
+                PatternInjector.verify_pattern(data, pattern)
 
 
 class TestDataGenerator:
     """Tests for main data generator."""
     
-    def test_basic_generation(self):
+    def test_basic_generation(self, basic_dataset):
         """Test basic data generation."""
+        generator, data = basic_dataset
+        
+        assert data.shape == (100, 50)
+        assert data.dtype == np.int8
+        assert generator.data is data
+    
+    def test_transaction_lengths(self):
+        """Test fixed (density) and Poisson transaction lengths."""
         config = {
             "dataset_meta": {
-                "num_transactions": 100,
-                "num_items": 50,
+                "num_transactions": 200,
+                "num_items": 40,
+                "density": 0.25,
+                "avg_transaction_len": None
+            },
+            "distribution_config": {
+                "method": "zipf",
+                "params": {"alpha": 1.2}
+            },
+            "pattern_injection": []
+        }
+        
+        generator = DataGenerator(config)
+        data = generator.generate(seed=7)
+        
+        # Density path: every transaction has exactly num_items * density items
+        assert (data.getnnz(axis=1) == 10).all()
+        
+        config["dataset_meta"]["avg_transaction_len"] = 6
+        generator = DataGenerator(config)
+        data = generator.generate(seed=7)
+        lengths = data.getnnz(axis=1)
+        
+        assert lengths.min() >= 1
+        assert lengths.max() <= 40
+        assert 5.0 <= lengths.mean() <= 7.0
+    
+    def test_block_sampling(self):
+        """Test that sampling in row blocks draws the same dataset."""
+        config = {
+            "dataset_meta": {
+                "num_transactions": 300,
+                "num_items": 40,
                 "density": 0.1,
-                "avg_transaction_len": 5
+                "avg_transaction_len": 6
             },
             "distribution_config": {
-                "method": "random",
-                "params": {}
+                "method": "zipf",
+                "params": {"alpha": 1.2}
             },
             "pattern_injection": []
         }
         
+        data = DataGenerator(config).generate(seed=3)
+        
         generator = DataGenerator(config)
-        data = generator.generate(seed=42)
+        generator.SAMPLE_BLOCK_CELLS = 40 * 7  # 7 rows per block
+        blocked = generator.generate(seed=3)
         
-        assert data.shape == (100, 50)
-        assert data.dtype == np.int8
+        assert (data != blocked).nnz == 0
     
-    def test_generation_with_patterns(self):
-        """Test generation with pattern injection."""
+    def test_generator_seed(self):
+        """Test that a Generator and its integer seed give the same dataset."""
         config = {
             "dataset_meta": {
-                "num_transactions": 500,
-                "num_items": 100,
-                "density": 0.08,
-                "avg_transaction_len": 8
+                "num_transactions": 200,
+                "num_items": 30,
+                "density": 0.1,
+                "avg_transaction_len": 4
             },
             "distribution_config": {
                 "method": "zipf",
                 "params": {"alpha": 1.1}
             },
             "pattern_injection": [
-                {
-                    "id": "test_pattern",
-                    "items": [10, 20, 30],
-                    "target_support": 0.1,
-                    "noise_ratio": 0.05
-                }
+                {"id": "p", "items": [1, 2], "target_support": 0.2}
+            ]
+        }
+        
+        data = DataGenerator(config).generate(seed=5)
+        from_rng = DataGenerator(config).generate(seed=np.random.default_rng(5))
+        
+        assert (data != from_rng).nnz == 0
+    
+    def test_repeated_seed(self):
+        """Test that generating twice with one seed gives the same dataset."""
+        config = {
+            "dataset_meta": {
+                "num_transactions": 100,
+                "num_items": 30,
+                "density": 0.1,
+                "avg_transaction_len": 4
+            },
+            "distribution_config": {
+                "method": "zipf",
+                "params": {"alpha": 1.1}
+            },
+            "pattern_injection": [
+                {"id": "p", "items": [3, 4], "target_support": 0.3},
+                # Above half the rows: drawn from the shuffled row buffer
+                {"id": "q", "items": [5, 6], "target_support": 0.8}
             ]
         }
         
         generator = DataGenerator(config)
-        data = generator.generate(seed=42)
+        first = generator.generate(seed=11)
+        second = generator.generate(seed=11)
+        
+        assert first is not second
+        assert (first != second).nnz == 0
+    
+    def test_generation_with_patterns(self, pattern_dataset):
+        """Test generation with pattern injection."""
+        generator, data = pattern_dataset
         
         stats = generator.get_statistics()
         
@@ -140,24 +332,41 @@ class TestDataGenerator:
         assert stats['num_patterns_injected'] == 1
         assert len(stats['injected_patterns']) == 1
     
-    def test_spmf_output(self, tmp_path):
-        """Test SPMF format output."""
+    def test_pattern_support(self, pattern_dataset):
+        """Test that the injected pattern reaches its target support."""
+        generator, data = pattern_dataset
+        
+        support = PatternInjector.verify_pattern(data, [10, 20, 30])
+        
+        assert 0.08 <= support <= 0.12
+    
+    def test_packed_output(self):
+        """Test bit-packed copy of the dataset."""
         config = {
             "dataset_meta": {
-                "num_transactions": 10,
-                "num_items": 20,
+                "num_transactions": 50,
+                "num_items": 21,
                 "density": 0.2,
                 "avg_transaction_len": 4
             },
             "distribution_config": {
-                "method": "random",
-                "params": {}
+                "method": "zipf",
+                "params": {"alpha": 1.1}
             },
             "pattern_injection": []
         }
         
         generator = DataGenerator(config)
-        generator.generate(seed=42)
+        data = generator.generate(seed=42)
+        packed = generator.to_packed()
+        
+        assert packed.shape == (50, 3)
+        unpacked = np.unpackbits(packed, axis=1, count=21)
+        assert (unpacked == data.toarray()).all()
+    
+    def test_spmf_output(self, tmp_path, basic_dataset):
+        """Test SPMF format output."""
+        generator, data = basic_dataset
         
         output_file = tmp_path / "test.spmf"
         generator.to_spmf(str(output_file))
@@ -168,7 +377,23 @@ class TestDataGenerator:
         with open(output_file, "r") as f:
             lines = f.readlines()
         
-        assert len(lines) == 10  # Should have 10 transactions
+        assert len(lines) == 100  # Should have 100 transactions
+        assert lines[0].split() == [str(i) for i in data[0].indices]
+    
+    def test_csv_output(self, tmp_path, basic_dataset):
+        """Test CSV (binary matrix) output."""
+        generator, data = basic_dataset
+        
+        output_file = tmp_path / "test.csv"
+        generator.to_csv(str(output_file), chunk_rows=30)
+        
+        with open(output_file, "r") as f:
+            header = f.readline().strip().split(",")
+        matrix = np.loadtxt(output_file, delimiter=",", skiprows=1, dtype=np.int8)
+        
+        assert header[0] == "item_0"
+        assert len(header) == 50
+        assert (matrix == data.toarray()).all()
 
 
 if __name__ == "__main__":
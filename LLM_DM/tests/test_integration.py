@@ -20,7 +20,7 @@ from utils.file_io import FileIO
 class TestIntegration:
     """Integration tests for the complete system."""
     
-    def test_full_generation_pipeline(self, tmp_path):
+    def test_full_generation_pipeline(self, tmp_path, parser, generate):
         """Test complete data generation pipeline."""
         # Step 1: Create config
         config = {
@@ -45,12 +45,11 @@ class TestIntegration:
         }
         
         # Step 2: Validate config
-        parser = ConfigParser()
         validated_config = parser.parse(config)
         
         # Step 3: Generate data
         generator = DataGenerator(validated_config)
-        data = generator.generate(seed=42)
+        data = generate(generator, 42)
         
         # Verify data shape
         assert data.shape == (200, 50)
@@ -100,7 +99,7 @@ class TestIntegration:
         assert data.shape[0] == 100
         assert data.shape[1] == 30
     
-    def test_multiple_patterns(self, tmp_path):
+    def test_multiple_patterns(self, tmp_path, parser):
         """Test generation with multiple injected patterns."""
         config = {
             "dataset_meta": {
@@ -134,7 +133,6 @@ class TestIntegration:
             ]
         }
         
-        parser = ConfigParser()
         validated = parser.parse(config)
         
         generator = DataGenerator(validated)
@@ -0,0 +1,182 @@
+"""
+Unit Tests for LLM Client Caching
+
+These tests do not require the openai package or an API key: the client
+is built without __init__ and talks to stub API clients.
+"""
+
+import asyncio
+import inspect
+import os
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from llm import client as client_module
+from llm.client import LLMClient
+
+
+def make_stream(content):
+    """Completion chunks streaming content in two pieces."""
+    middle = len(content) // 2
+    return [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+        for part in (content[:middle], content[middle:])
+    ]
+
+
+class FakeCompletions:
+    """Sync chat.completions stub answering {"call": <call number>}."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return iter(make_stream(f'{{"call": {len(self.calls)}}}'))
+
+
+class FakeAsyncOpenAI:
+    """AsyncOpenAI stub checking it is only used in the loop it was opened in."""
+    
+    instances = []
+    
+    def __init__(self):
+        self.loop = None
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        FakeAsyncOpenAI.instances.append(self)
+    
+    async def __aenter__(self):
+        self.loop = asyncio.get_running_loop()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+    
+    async def create(self, **kwargs):
+        assert not self.closed
+        assert asyncio.get_running_loop() is self.loop
+        prompt = kwargs["messages"][1]["content"]
+        
+        async def stream():
+            for chunk in make_stream(f'{{"prompt": "{prompt}"}}'):
+                yield chunk
+        
+        return stream()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client with stub API clients and a temporary cache directory."""
+    monkeypatch.setattr(client_module, "CACHE_DIR", tmp_path / "cache")
+    FakeAsyncOpenAI.instances = []
+    
+    llm = LLMClient.__new__(LLMClient)
+    llm.provider = "openai"
+    llm.model = "test-model"
+    llm.temperature = 0.3
+    llm.max_tokens = 2000
+    llm.timeout = 30
+    llm.use_cache = False
+    llm._prompt_cache = {}
+    llm.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    llm._async_client_factory = FakeAsyncOpenAI
+    return llm
+
+
+@pytest.fixture
+def prompt_file(tmp_path):
+    """System prompt file."""
+    path = tmp_path / "system.txt"
+    path.write_text("Return a JSON configuration.", encoding="utf-8")
+    return str(path)
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache."""
+    
+    def test_no_cache_by_default(self, client, prompt_file, tmp_path):
+        """Test that caching is opt-in and nothing is stored without it."""
+        default = inspect.signature(LLMClient.__init__).parameters["use_cache"].default
+        assert default is False
+        
+        first = client.generate_config("sparse data", prompt_file)
+        second = client.generate_config("sparse data", prompt_file)
+        
+        assert first == {"call": 1}
+        assert second == {"call": 2}
+        assert not (tmp_path / "cache").exists()
+    
+    def test_cache_hit_and_miss(self, client, prompt_file):
+        """Test that identical requests are answered from the cache."""
+        client.use_cache = True
+        
+        first = client.generate_config("sparse data", prompt_file)
+        second = client.generate_config("sparse data", prompt_file)
+        other = client.generate_config("dense data", prompt_file)
+        
+        assert first == second == {"call": 1}
+        assert other == {"call": 2}
+        assert len(client.client.chat.completions.calls) == 2
+    
+    def test_cache_key(self, client):
+        """Test that the cache key is stable and covers every request input."""
+        key = client._cache_path("system", "user")
+        
+        assert client._cache_path("system", "user") == key
+        assert client._cache_path("system", "other user") != key
+        assert client._cache_path("other system", "user") != key
+        
+        client.model = "other-model"
+        assert client._cache_path("system", "user") != key
+        client.model = "test-model"
+        
+        client.temperature = 0.7
+        assert client._cache_path("system", "user") != key
+        client.temperature = 0.3
+        
+        assert client._cache_path("system", "user") == key
+    
+    def test_system_prompt_reload(self, client, prompt_file):
+        """Test that the system prompt is re-read only when its mtime changes."""
+        assert client._load_system_prompt(prompt_file) == "Return a JSON configuration."
+        
+        mtime = os.stat(prompt_file).st_mtime_ns
+        Path(prompt_file).write_text("Changed.", encoding="utf-8")
+        
+        os.utime(prompt_file, ns=(mtime, mtime))
+        assert client._load_system_prompt(prompt_file) == "Return a JSON configuration."
+        
+        os.utime(prompt_file, ns=(mtime + 10**9, mtime + 10**9))
+        assert client._load_system_prompt(prompt_file) == "Changed."
+
+
+class TestAsync:
+    """Tests for concurrent generation."""
+    
+    def test_generate_configs_twice(self, client, prompt_file):
+        """Test that each batch opens and closes its own async client."""
+        first = client.generate_configs(["a", "b"], prompt_file)
+        second = client.generate_configs(["c"], prompt_file)
+        
+        assert first == [{"prompt": "a"}, {"prompt": "b"}]
+        assert second == [{"prompt": "c"}]
+        assert len(FakeAsyncOpenAI.instances) == 2
+        assert all(instance.closed for instance in FakeAsyncOpenAI.instances)
+    
+    def test_generate_config_async(self, client, prompt_file):
+        """Test single async requests across event loops."""
+        for prompt in ("a", "b"):
+            config = asyncio.run(client.generate_config_async(prompt, prompt_file))
+            assert config == {"prompt": prompt}
+        
+        assert all(instance.closed for instance in FakeAsyncOpenAI.instances)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -16,7 +16,7 @@ from llm.parser import ConfigParser, ConfigValidationError
 class TestConfigParser:
     """Tests for configuration parser."""
     
-    def test_valid_config(self):
+    def test_valid_config(self, parser):
         """Test parsing a valid configuration."""
         config = {
             "dataset_meta": {
@@ -31,14 +31,13 @@ class TestConfigParser:
             "pattern_injection": []
         }
         
-        parser = ConfigParser()
         validated = parser.parse(config)
         
         assert validated["dataset_meta"]["num_transactions"] == 1000
         assert validated["dataset_meta"]["num_items"] == 100
         assert validated["distribution_config"]["method"] == "zipf"
     
-    def test_missing_required_fields_strict(self):
+    def test_missing_required_fields_strict(self, parser):
         """Test that missing required fields raise error in strict mode."""
         config = {
             "dataset_meta": {
@@ -51,12 +50,10 @@ class TestConfigParser:
             }
         }
         
-        parser = ConfigParser(strict_mode=True)
-        
         with pytest.raises(ConfigValidationError):
             parser.parse(config)
     
-    def test_missing_required_fields_non_strict(self):
+    def test_missing_required_fields_non_strict(self, lenient_parser):
         """Test that missing fields get defaults in non-strict mode."""
         config = {
             "dataset_meta": {
@@ -69,14 +66,13 @@ class TestConfigParser:
             }
         }
         
-        parser = ConfigParser(strict_mode=False)
-        validated = parser.parse(config)
+        validated = lenient_parser.parse(config)
         
         # Should have default num_items
         assert "num_items" in validated["dataset_meta"]
         assert validated["dataset_meta"]["num_items"] > 0
     
-    def test_invalid_density(self):
+    def test_invalid_density(self, parser):
         """Test that invalid density raises error."""
         config = {
             "dataset_meta": {
@@ -90,12 +86,10 @@ class TestConfigParser:
             }
         }
         
-        parser = ConfigParser()
-        
         with pytest.raises(ConfigValidationError):
             parser.parse(config)
     
-    def test_pattern_injection_validation(self):
+    def test_pattern_injection_validation(self, parser):
         """Test pattern injection validation."""
         config = {
             "dataset_meta": {
@@ -116,13 +110,12 @@ class TestConfigParser:
             ]
         }
         
-        parser = ConfigParser()
         validated = parser.parse(config)
         
         assert len(validated["pattern_injection"]) == 1
         assert validated["pattern_injection"][0]["items"] == [1, 5, 10]
     
-    def test_invalid_pattern_support(self):
+    def test_invalid_pattern_support(self, parser):
         """Test that invalid support raises error."""
         config = {
             "dataset_meta": {
@@ -142,8 +135,6 @@ class TestConfigParser:
             ]
         }
         
-        parser = ConfigParser(strict_mode=True)
-        
         with pytest.raises(ConfigValidationError):
             parser.parse(config)
     
@@ -0,0 +1,80 @@
+"""
+Unit Tests for Metrics Calculator Module
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from benchmark.metrics import MetricsCalculator
+
+
+class TestMetricsCalculator:
+    """Tests for accuracy metrics."""
+    
+    def test_accuracy(self):
+        """Test precision/recall against ground truth."""
+        ground_truth = [
+            {"items": [1, 2, 3], "target_support": 0.1},
+            {"items": [5, 10], "target_support": 0.05}
+        ]
+        found_patterns = [
+            {"items": [3, 2, 1], "support": 100},  # Item order is irrelevant
+            {"items": [7, 8], "support": 40}  # False positive
+        ]
+        
+        calculator = MetricsCalculator(ground_truth)
+        accuracy = calculator.calculate_accuracy(found_patterns, 0.04)
+        
+        assert accuracy["true_positives"] == 1
+        assert accuracy["false_positives"] == 1
+        assert accuracy["false_negatives"] == 1
+        assert accuracy["precision"] == 0.5
+        assert accuracy["recall"] == 0.5
+    
+    def test_accuracy_threshold(self):
+        """Test that ground truth below min support is ignored."""
+        ground_truth = [
+            {"items": [1, 2, 3], "target_support": 0.1},
+            {"items": [5, 10], "target_support": 0.05}
+        ]
+        found_patterns = [{"items": [1, 2, 3], "support": 100}]
+        
+        calculator = MetricsCalculator(ground_truth)
+        accuracy = calculator.calculate_accuracy(found_patterns, 0.08)
+        
+        assert accuracy["ground_truth_count"] == 1
+        assert accuracy["recall"] == 1.0
+        assert accuracy["f1_score"] == 1.0
+    
+    def test_repeated_thresholds(self):
+        """Test that cached ground truth sets follow each threshold."""
+        ground_truth = [
+            {"items": [5, 10], "target_support": 0.05},
+            {"items": [1, 2, 3], "target_support": 0.1}
+        ]
+        found_patterns = [{"items": [5, 10], "support": 50}]
+        
+        calculator = MetricsCalculator(ground_truth)
+        
+        for _ in range(2):
+            low = calculator.calculate_accuracy(found_patterns, 0.05)
+            high = calculator.calculate_accuracy(found_patterns, 0.1)
+            assert low["true_positives"] == 1
+            assert low["ground_truth_count"] == 2
+            assert high["true_positives"] == 0
+            assert high["ground_truth_count"] == 1
+    
+    def test_no_ground_truth(self):
+        """Test metrics without ground truth."""
+        calculator = MetricsCalculator()
+        accuracy = calculator.calculate_accuracy([{"items": [1]}], 0.1)
+        
+        assert accuracy["precision"] is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+"""
+Unit Tests for SPMF Runner Output Handling
+
+These tests do not require Java or spmf.jar: they only exercise the
+helpers that read SPMF output files.
+"""
+
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from benchmark.spmf_runner import SPMFRunner
+
+
+@pytest.fixture
+def runner():
+    """Runner instance that skips the jar/Java checks of __init__."""
+    return SPMFRunner.__new__(SPMFRunner)
+
+
+class TestOutputFiles:
+    """Tests for SPMF output file handling."""
+    
+    def test_count_lines(self, tmp_path):
+        """Test pattern counting with and without trailing newline."""
+        output_file = tmp_path / "out.txt"
+        
+        output_file.write_bytes(b"")
+        assert SPMFRunner._count_lines(str(output_file)) == 0
+        
+        output_file.write_bytes(b"1 2 #SUP: 5\n3 #SUP: 4\n")
+        assert SPMFRunner._count_lines(str(output_file)) == 2
+        
+        output_file.write_bytes(b"1 2 #SUP: 5\n3 #SUP: 4")
+        assert SPMFRunner._count_lines(str(output_file), block_size=4) == 2
+    
+    def test_parse_output(self, runner, tmp_path):
+        """Test parsing itemsets with and without support."""
+        output_file = tmp_path / "out.txt"
+        output_file.write_text("1 2 3 #SUP: 12\n\n7 #SUP: 40\n4 5\n")
+        
+        patterns = runner.parse_output(str(output_file))
+        
+        assert patterns == [
+            {"items": [1, 2, 3], "support": 12},
+            {"items": [7], "support": 40},
+            {"items": [4, 5], "support": None}
+        ]
+
+
+class TestRunMany:
+    """Tests for parallel algorithm runs."""
+    
+    def test_results_follow_job_order(self, runner):
+        """Test that results are returned in job order."""
+        def fake_run(algorithm, delay, **kwargs):
+            time.sleep(delay)
+            return {"algorithm": algorithm}
+        
+        runner.run_algorithm = fake_run
+        jobs = [
+            {"algorithm": "Apriori", "delay": 0.05},
+            {"algorithm": "FPGrowth", "delay": 0.0},
+            {"algorithm": "Eclat", "delay": 0.02}
+        ]
+        
+        results = runner.run_many(jobs, max_workers=3)
+        
+        assert [r["algorithm"] for r in results] == ["Apriori", "FPGrowth", "Eclat"]
+        assert runner.run_many([]) == []
+    
+    def test_return_exceptions(self, runner):
+        """Test that a failing job does not discard the other results."""
+        def fake_run(algorithm, **kwargs):
+            if algorithm == "FPGrowth":
+                raise RuntimeError("SPMF execution failed")
+            return {"algorithm": algorithm}
+        
+        runner.run_algorithm = fake_run
+        jobs = [{"algorithm": "Apriori"}, {"algorithm": "FPGrowth"}, {"algorithm": "Eclat"}]
+        
+        with pytest.raises(RuntimeError):
+            runner.run_many(jobs)
+        
+        results = runner.run_many(jobs, return_exceptions=True)
+        
+        assert results[0] == {"algorithm": "Apriori"}
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == {"algorithm": "Eclat"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])